@@ -5,25 +5,12 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from models import Commit
-from utils.data_processing import queryset_to_dataframe, create_time_series_chart, add_trendline
+from utils.data_processing import create_time_series_chart, add_trendline
+from utils.database import load_core_frame
 
-@st.cache_data(ttl=600)
 def get_commit_data(selected_repos, start_date, end_date):
     """Get commit data with caching"""
-    if selected_repos:
-        query = Commit.objects(
-            repo__in=selected_repos,
-            committed_at__gte=start_date,
-            committed_at__lte=end_date
-        )
-    else:
-        query = Commit.objects(
-            committed_at__gte=start_date,
-            committed_at__lte=end_date
-        )
-    
-    return queryset_to_dataframe(query)
+    return load_core_frame('commits', selected_repos, start_date, end_date)
 
 def render_commit_metrics(selected_repos, start_date, end_date):
     """
@@ -9,14 +9,14 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
-from components.runners import get_workflow_data
 from models import Issue, PullRequest
-from utils.data_processing import queryset_to_dataframe
+from utils.database import fetch_filtered, load_core_frame, TEAM_PR_FIELDS
 from utils.team_utils import get_team_data, augment_dataframe_with_team_info
-from utils.dora_metrics import calculate_deployment_frequency, calculate_lead_time, render_deployment_frequency_chart, render_lead_time_chart, render_pr_frequency_chart
-from components.metrics.pull_requests import get_pr_data
+from utils.dora_metrics import get_deployment_frequency, calculate_lead_time, render_deployment_frequency_chart, render_lead_time_chart, render_pr_frequency_chart
+
+# Fields the team views read from issues
+TEAM_ISSUE_FIELDS = ['repo', 'project_key', 'author', 'assignee', 'status', 'created_at', 'closed_at']
 
-@st.cache_data(ttl=600)
 def get_issue_data(selected_repos, selected_projects, start_date, end_date, closed_only=True):
     """
     Get issue data from database
@@ -31,26 +31,17 @@ def get_issue_data(selected_repos, selected_projects, start_date, end_date, clos
     Returns:
         DataFrame with issue data
     """
-    filter_args = {
-        'closed_at__gte': start_date,
-        'closed_at__lte': end_date
-    } if closed_only else {
-        'created_at__gte': start_date,
-        'created_at__lte': end_date
-    }
-        
-    # Apply repo filter if available
-    if selected_repos:
-        filter_args['repo__in'] = selected_repos
+    extra_query = {}
         
     # Apply project filter if available
     if selected_projects:
-        filter_args['project_key__in'] = selected_projects
+        extra_query['project_key'] = {'$in': list(selected_projects)}
     
-    query = Issue.objects(**filter_args)
-    return queryset_to_dataframe(query)
+    return fetch_filtered(Issue, selected_repos, start_date, end_date,
+                          fields=TEAM_ISSUE_FIELDS,
+                          date_field='closed_at' if closed_only else 'created_at',
+                          extra_query=extra_query)
 
-@st.cache_data(ttl=600)
 def get_pr_review_data(selected_repos, start_date, end_date):
     """
     Get PR review data including reviewer information
@@ -67,17 +58,9 @@ def get_pr_review_data(selected_repos, start_date, end_date):
     # This is a placeholder that would need to be implemented based on your data model
     
     # For MongoDB, you might need to use aggregation to get this data
-    filter_args = {
-        'created_at__gte': start_date,
-        'created_at__lte': end_date,
-    }
-    
-    if selected_repos:
-        filter_args['repo__in'] = selected_repos
-    
     # Get PRs with reviews
-    prs = PullRequest.objects(**filter_args)
-    return queryset_to_dataframe(prs)
+    return fetch_filtered(PullRequest, selected_repos, start_date, end_date,
+                          fields=TEAM_PR_FIELDS)
 
 def render_pr_throughput(pr_df, group_by='team', title_prefix='Team'):
     """
@@ -156,9 +139,13 @@ def render_team_insights(selected_repos, start_date, end_date):
     else:
         show_repo_based_metrics = False
     
-    # Get PR data 
-    pr_all_df = get_pr_data(selected_repos, start_date, end_date)
-    pr_merged_df = get_pr_data(selected_repos, start_date, end_date, merged_only=True)
+    # Get PR data (only the fields the team views read); merged PRs are the
+    # subset with a merge date, so no second query is needed
+    pr_all_df = load_core_frame('prs', selected_repos, start_date, end_date)
+    if 'merged_at' in pr_all_df.columns:
+        pr_merged_df = pr_all_df[pr_all_df['merged_at'].notna()]
+    else:
+        pr_merged_df = pr_all_df.iloc[0:0]
     
     # Fetch issue data (only supply empty list for projects to get all projects)
     issue_df = get_issue_data(selected_repos, [], start_date, end_date)
@@ -263,10 +250,8 @@ def render_team_insights(selected_repos, start_date, end_date):
         else:
             st.warning("No pull request data found for the selected repositories and date range. Try adjusting your filters.")
 
-        workflow_df = get_workflow_data(selected_repos, start_date, end_date)
-        
-        # Calculate deployment frequency
-        deploy_freq_df = calculate_deployment_frequency(workflow_df, start_date, end_date)
+        # Calculate deployment frequency (grouped in MongoDB)
+        deploy_freq_df = get_deployment_frequency(selected_repos, start_date, end_date)
         
         if not deploy_freq_df.empty:
             # Render deployment frequency chart
@@ -322,7 +307,7 @@ def render_code_review_metrics(pr_df, team_df):
     title_prefix = 'Team' if group_by == 'team' else 'Repository'
     
     # Calculate average review count by group
-    reviews_by_group = pr_df.groupby(group_by)['review_count'].mean().reset_index()
+    reviews_by_group = pr_df.groupby(group_by, observed=True)['review_count'].mean().reset_index()
     reviews_by_group['avg_reviews'] = reviews_by_group['review_count'].round(2)
     
     # Filter out unmapped team (optional)
@@ -10,26 +10,13 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from models import WorkflowRun
-from utils.data_processing import queryset_to_dataframe, create_time_series_chart, calculate_trend_metrics
+from utils.data_processing import create_time_series_chart, calculate_trend_metrics
+from utils.database import load_core_frame
 from utils.dora_metrics import calculate_deployment_frequency, render_deployment_frequency_chart
 
-@st.cache_data(ttl=600)
 def get_workflow_data(selected_repos, start_date, end_date):
     """Get workflow run data with caching"""
-    if selected_repos:
-        query = WorkflowRun.objects(
-            repo__in=selected_repos,
-            created_at__gte=start_date,
-            created_at__lte=end_date
-        )
-    else:
-        query = WorkflowRun.objects(
-            created_at__gte=start_date,
-            created_at__lte=end_date
-        )
-    
-    return queryset_to_dataframe(query)
+    return load_core_frame('workflows', selected_repos, start_date, end_date)
 
 def render_runner_performance(selected_repos, start_date, end_date):
     """
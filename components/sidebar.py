@@ -6,18 +6,16 @@ from datetime import datetime, timedelta
 from models import Issue, Repository
 from config.settings import TIMEFRAMES, DEFAULT_TIMEFRAME
 
-def render_sidebar():
+@st.cache_data(ttl=600)
+def _load_sidebar_options():
     """
-    Render sidebar with filters and return selected values
+    Load the repository and project filter options from the database
     
     Returns:
-        tuple: (selected_repos, selected_projects, start_date, end_date)
+        tuple: (repos, projects) as sorted repository names and Jira project keys
     """
-    st.sidebar.header("Filters")
-
-    # Get list of repositories and projects
     repos = []
-    for repo in Repository.objects:
+    for repo in Repository.objects.only('owner', 'name'):
         if repo.owner and repo.name:
             repos.append(f"{repo.owner}/{repo.name}")
     
@@ -25,6 +23,21 @@ def render_sidebar():
     repos = sorted(repos)
     
     projects = Issue.objects.distinct('project_key')
+    
+    return repos, projects
+
+def render_sidebar():
+    """
+    Render sidebar with filters and return selected values
+    
+    Returns:
+        tuple: (selected_repos, selected_projects, start_date, end_date)
+    """
+    st.sidebar.header("Filters")
+
+    # Get list of repositories and projects (cached across reruns and sessions;
+    # the "Refresh Data" button below clears it)
+    repos, projects = _load_sidebar_options()
 
     # Repository selection
     selected_repos = st.sidebar.multiselect("Select Repositories", repos, default=repos)
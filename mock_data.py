@@ -1,49 +1,74 @@
 import mongoengine as me
 import random
-import uuid
 from datetime import datetime, timedelta
 import time
+import bisect
+from itertools import accumulate
+import queue
+import threading
+from multiprocessing import Pool
 from tqdm import tqdm
 import numpy as np
+import pandas as pd
+from pymongo import WriteConcern
 from models import PullRequest, Issue, Commit, WorkflowRun, Team, Repository
 
-def random_hour_of_day(dev_work_pattern="business"):
+# Seed for every random stream in this module (None = fresh entropy on every run)
+RANDOM_SEED = None
+
+# Root seed sequence - every random stream in this module derives from it. _RNG is the
+# shared NumPy generator; _PY_RNG serves the remaining scalar stdlib-style draws
+_SEEDSEQ = np.random.SeedSequence(RANDOM_SEED)
+_RNG = np.random.default_rng(_SEEDSEQ)
+_PY_RNG = random.Random(int(_SEEDSEQ.spawn(1)[0].generate_state(1, np.uint64)[0]))
+
+def _hour_distribution(*parts):
+    """Probability of each hour 0-23 for a mixture of (weight, hours) uniform parts"""
+    probabilities = np.zeros(24)
+    for weight, hours in parts:
+        np.add.at(probabilities, hours, weight / len(hours))
+    return probabilities
+
+# Hour-of-day probabilities for each work pattern: "business" is mostly 9am-5pm,
+# "night_owl" leans toward evening/night hours and "distributed" is evenly spread
+HOUR_DISTRIBUTIONS = {
+    "business": _hour_distribution(
+        (0.8, list(range(9, 18))),
+        (0.2, [7, 8, 18, 19, 20] + list(range(0, 24)))
+    ),
+    "night_owl": _hour_distribution(
+        (0.7 * 0.7, list(range(18, 24))),
+        (0.7 * 0.3, list(range(0, 7))),
+        (0.3, list(range(9, 18)))
+    ),
+    "distributed": _hour_distribution((1.0, list(range(24))))
+}
+
+# Work pattern names by the work_pattern code in developer characteristics
+WORK_PATTERNS = ["distributed", "business", "night_owl"]
+
+def random_hours_batch(dev_work_pattern, size, rng=None):
     """
-    Generate a random hour of the day based on work patterns
+    Draw `size` random hours of the day for one work pattern at once
     
     Args:
-        dev_work_pattern: 
-            "business" - mostly 9am-5pm
-            "night_owl" - evening/night hours
-            "distributed" - evenly spread
+        dev_work_pattern: "business", "night_owl" or "distributed"
+        size: Number of hours to draw
+        rng: numpy.random.Generator to draw from (defaults to the module stream)
     
     Returns:
-        Hour of day (0-23)
+        int64 NumPy array of hours (0-23)
     """
-    if dev_work_pattern == "business":
-        # Business hours distribution (peaks during 9am-5pm)
-        if random.random() < 0.8:  # 80% during business hours
-            return random.randint(9, 17)
-        else:
-            # Remaining 20% distributed with morning/evening bias
-            return random.choice([7, 8, 18, 19, 20] + list(range(0, 24)))
-    elif dev_work_pattern == "night_owl":
-        # Night owl (peaks in evening/night)
-        if random.random() < 0.7:  # 70% evening/night
-            return random.randint(18, 23) if random.random() < 0.7 else random.randint(0, 6)
-        else:
-            # 30% during the day
-            return random.randint(9, 17)
-    else:  # distributed
-        # More evenly distributed
-        return random.randint(0, 23)            # More varied commit message styles
+    return (rng if rng is not None else _RNG).choice(24, size=size, p=HOUR_DISTRIBUTIONS[dev_work_pattern])
+
+# More varied commit message styles
 message_styles = [
     # Conventional commits style
-    f"{random.choice(['feat', 'fix', 'docs', 'style', 'refactor', 'test', 'chore'])}{random.choice(['', '(scope)'])}: {random.choice(['Add', 'Update', 'Remove', 'Fix'])} {random.choice(['feature', 'component', 'test', 'dependency', 'documentation'])}",
+    f"{_PY_RNG.choice(['feat', 'fix', 'docs', 'style', 'refactor', 'test', 'chore'])}{_PY_RNG.choice(['', '(scope)'])}: {_PY_RNG.choice(['Add', 'Update', 'Remove', 'Fix'])} {_PY_RNG.choice(['feature', 'component', 'test', 'dependency', 'documentation'])}",
     # Simple style
-    f"{random.choice(['Add', 'Fix', 'Update', 'Implement', 'Refactor', 'Remove', 'Optimize'])} {random.choice(['feature', 'bug', 'performance issue', 'UI component', 'API endpoint', 'documentation', 'test'])}",
+    f"{_PY_RNG.choice(['Add', 'Fix', 'Update', 'Implement', 'Refactor', 'Remove', 'Optimize'])} {_PY_RNG.choice(['feature', 'bug', 'performance issue', 'UI component', 'API endpoint', 'documentation', 'test'])}",
     # Detailed style
-    f"{random.choice(['Added', 'Fixed', 'Updated', 'Implemented', 'Refactored'])} {random.choice(['the', 'a'])} {random.choice(['main', 'core', 'critical', 'optional'])} {random.choice(['feature', 'component', 'module', 'function', 'service'])} for {random.choice(['better performance', 'improved UX', 'compatibility', 'stability'])}"
+    f"{_PY_RNG.choice(['Added', 'Fixed', 'Updated', 'Implemented', 'Refactored'])} {_PY_RNG.choice(['the', 'a'])} {_PY_RNG.choice(['main', 'core', 'critical', 'optional'])} {_PY_RNG.choice(['feature', 'component', 'module', 'function', 'service'])} for {_PY_RNG.choice(['better performance', 'improved UX', 'compatibility', 'stability'])}"
 ]            
 common_verbs = ["Add", "Fix", "Update", "Implement", "Refactor", "Remove", "Optimize", "Improve", "Streamline", "Enhance"]
 common_targets = ["feature", "bug", "performance issue", "UI component", "API endpoint", "documentation", "test", "workflow", "configuration", "dependency", "accessibility", "error handling"]
@@ -57,6 +82,10 @@ common_targets = ["feature", "bug", "performance issue", "UI component", "API en
 SIMULATION_END_DATE = datetime.now()
 SIMULATION_START_DATE = SIMULATION_END_DATE - timedelta(days=365)  # Last year
 
+# One timedelta per hour of the day, added to midnight-truncated dates instead of
+# datetime.replace(hour=...)
+HOUR_OFFSETS = [timedelta(hours=hour) for hour in range(24)]
+
 # Organization structure
 ORG_NAME = "mock-org"
 REPOS = ["frontend", "backend", "infra"]
@@ -68,29 +97,29 @@ TEAM_CONFIG = {
         "size_pct_range": (0.15, 0.45),  # Range instead of fixed percentage
         "repo_focus": {"frontend": 0.8, "backend": 0.15, "infra": 0.05},
         "description": "The Frontend team is responsible for user interfaces and client-side development.",
-        "productivity_factor": random.uniform(0.7, 1.3),  # Some teams are more efficient
-        "quality_factor": random.uniform(0.7, 1.3)  # Some teams produce higher quality work
+        "productivity_factor": _PY_RNG.uniform(0.7, 1.3),  # Some teams are more efficient
+        "quality_factor": _PY_RNG.uniform(0.7, 1.3)  # Some teams produce higher quality work
     },
     "Backend": {
         "size_pct_range": (0.15, 0.45),
         "repo_focus": {"frontend": 0.1, "backend": 0.8, "infra": 0.1},
         "description": "The Backend team is responsible for APIs, databases, and server-side logic.",
-        "productivity_factor": random.uniform(0.7, 1.3),
-        "quality_factor": random.uniform(0.7, 1.3)
+        "productivity_factor": _PY_RNG.uniform(0.7, 1.3),
+        "quality_factor": _PY_RNG.uniform(0.7, 1.3)
     },
     "DevOps": {
         "size_pct_range": (0.1, 0.3),
         "repo_focus": {"frontend": 0.05, "backend": 0.15, "infra": 0.8},
         "description": "The DevOps team is responsible for infrastructure, CI/CD, and operations.",
-        "productivity_factor": random.uniform(0.7, 1.3),
-        "quality_factor": random.uniform(0.7, 1.3)
+        "productivity_factor": _PY_RNG.uniform(0.7, 1.3),
+        "quality_factor": _PY_RNG.uniform(0.7, 1.3)
     },
     "QA": {
         "size_pct_range": (0.05, 0.2),
         "repo_focus": {"frontend": 0.33, "backend": 0.33, "infra": 0.34},
         "description": "The QA team is responsible for quality assurance and testing.",
-        "productivity_factor": random.uniform(0.7, 1.3),
-        "quality_factor": random.uniform(0.7, 1.3)
+        "productivity_factor": _PY_RNG.uniform(0.7, 1.3),
+        "quality_factor": _PY_RNG.uniform(0.7, 1.3)
     }
 }
 
@@ -105,90 +134,340 @@ COMMITS_PER_REPO = 5000
 WORKFLOW_RUNS_PER_REPO = 2500
 
 # Batch size for database operations
-BATCH_SIZE = 500
+BATCH_SIZE = 10000
+
+# Background threads that write finished batches while generation continues,
+# and how many batches may wait for them before generation blocks
+WRITER_THREADS = 3
+WRITE_QUEUE_SIZE = 4
+
+# Progress bars advance once per this many generated items rather than per item
+PROGRESS_STEP = 1000
+
+# Run mongoengine validation over every document before it is bulk inserted
+VALIDATE_MOCK_DATA = False
+
+# Write concern for the seeding inserts: acknowledged, so failed inserts (e.g. duplicate
+# _ids) raise and every batch is on the server before the indexes are rebuilt, but not
+# journaled. Only fast_bulk_insert uses it; everything else keeps the connection's default
+SEED_WRITE_CONCERN = WriteConcern(w=1, j=False)
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def weighted_choice(choices, weights):
-    """Make a weighted random choice from a list of options"""
-    return random.choices(choices, weights=weights, k=1)[0]
+# Child seed sequences handed out by get_worker_rng, in worker order
+_WORKER_SEEDS = []
+
+def get_worker_rng(worker_id):
+    """
+    Get an independent random generator for a parallel worker
+    
+    Child seeds are spawned from the root seed sequence on first use and cached,
+    so a given worker always receives the same stream and no two workers share
+    (or overlap) a stream.
+    
+    Args:
+        worker_id: Zero-based index of the worker
+    
+    Returns:
+        numpy.random.Generator seeded for that worker
+    """
+    if worker_id >= len(_WORKER_SEEDS):
+        _WORKER_SEEDS.extend(_SEEDSEQ.spawn(worker_id + 1 - len(_WORKER_SEEDS)))
+    return np.random.default_rng(_WORKER_SEEDS[worker_id])
+
+def fast_bulk_insert(model_cls, docs):
+    """
+    Bulk insert documents straight through pymongo
+    
+    Bypasses mongoengine's QuerySet.insert and sends one unordered insert_many
+    through a collection handle that uses SEED_WRITE_CONCERN (acknowledged, no
+    journal). That is fine for throwaway mock data but must not be used for
+    anything that has to be durable.
+    
+    Args:
+        model_cls: mongoengine Document class whose collection receives the docs
+        docs: List of model_cls instances, or dicts already in MongoDB document form
+    
+    Returns:
+        Number of documents inserted
+    
+    Raises:
+        pymongo.errors.BulkWriteError: If any document in the batch failed to insert
+    """
+    if not docs:
+        return 0
+    
+    # Optional single validation pass instead of mongoengine's per-insert checks
+    if VALIDATE_MOCK_DATA:
+        for doc in docs:
+            if isinstance(doc, dict):
+                doc = model_cls._from_son(doc)
+            doc.validate()
+    
+    collection = model_cls._get_db().get_collection(
+        model_cls._get_collection_name(), write_concern=SEED_WRITE_CONCERN
+    )
+    result = collection.insert_many(
+        [doc if isinstance(doc, dict) else doc.to_mongo() for doc in docs], ordered=False
+    )
+    return len(result.inserted_ids)
+
+def _bulk_writer(write_queue, results):
+    """Writer thread loop: insert (model_cls, docs) batches until a None sentinel arrives"""
+    while True:
+        batch = write_queue.get()
+        if batch is None:
+            break
+        
+        # Keep draining the queue after a failure so generation never blocks on it;
+        # stop_bulk_writers re-raises the error once everything has been consumed
+        if results["errors"]:
+            continue
+        model_cls = batch[0]
+        try:
+            inserted = fast_bulk_insert(*batch)
+        except Exception as e:
+            with results["lock"]:
+                results["errors"].append(e)
+            continue
+        with results["lock"]:
+            results["inserted"][model_cls.__name__] = results["inserted"].get(model_cls.__name__, 0) + inserted
+
+def start_bulk_writers(num_threads=WRITER_THREADS):
+    """
+    Start background threads that bulk insert batches handed to them
+    
+    Generation puts (model_cls, docs) tuples on the returned queue and moves on,
+    so database writes overlap with building the next batch. The queue is
+    bounded, which keeps memory in check if writes fall behind.
+    
+    Args:
+        num_threads: Number of writer threads
+    
+    Returns:
+        Tuple of (write_queue, threads, results) to pass to stop_bulk_writers
+    """
+    write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+    
+    # Shared between the writer threads: inserted document counts per model name
+    # and any insert errors
+    results = {"inserted": {}, "errors": [], "lock": threading.Lock()}
+    
+    threads = [
+        threading.Thread(target=_bulk_writer, args=(write_queue, results), daemon=True)
+        for _ in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    return write_queue, threads, results
+
+def stop_bulk_writers(write_queue, threads, results):
+    """
+    Wait for every queued batch to be written, then shut the writer threads down
+    
+    Returns:
+        Dictionary mapping model class names to the number of documents inserted
+    
+    Raises:
+        RuntimeError: If a batch failed to insert (chained to the first error)
+    """
+    for _ in threads:
+        write_queue.put(None)
+    for thread in threads:
+        thread.join()
+    
+    if results["errors"]:
+        raise RuntimeError(
+            "Bulk insert failed during mock data generation; batches queued after the "
+            "failure were skipped"
+        ) from results["errors"][0]
+    return results["inserted"]
+
+def dataframe_to_documents(df):
+    """
+    Convert a DataFrame of generated rows into documents for fast_bulk_insert
+    
+    Missing values (None/NaN/NaT) are left out of each document entirely, the
+    same way Document.to_mongo() leaves out unset fields.
+    
+    Args:
+        df: DataFrame whose column names are MongoDB field names
+    
+    Returns:
+        List of document dicts, one per row
+    """
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    return [{key: value for key, value in record.items() if value is not None} for record in records]
+
+def progress_range(total, desc, position=None):
+    """
+    range(total) with a tqdm progress bar that is only touched once per PROGRESS_STEP items
+    
+    Args:
+        total: Number of items to iterate over
+        desc: Progress bar label
+        position: Line offset of the bar, for bars drawn by parallel workers
+    
+    Yields:
+        0 .. total - 1
+    """
+    with tqdm(total=total, desc=desc, position=position, mininterval=0.5) as progress:
+        for start in range(0, total, PROGRESS_STEP):
+            stop = min(start + PROGRESS_STEP, total)
+            yield from range(start, stop)
+            progress.update(stop - start)
+
+def build_alias_table(weights):
+    """
+    Build a Walker/Vose alias table for repeated weighted picks from the same weights
+    
+    Args:
+        weights: Non-negative weights (need not be normalized)
+    
+    Returns:
+        (probabilities, aliases) lists for sample_alias
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    probabilities = [1.0] * n
+    aliases = list(range(n))
+    
+    # Pair every under-full slot with an over-full one that tops it up
+    small = [idx for idx, p in enumerate(scaled) if p < 1.0]
+    large = [idx for idx, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        small_idx = small.pop()
+        large_idx = large.pop()
+        probabilities[small_idx] = scaled[small_idx]
+        aliases[small_idx] = large_idx
+        scaled[large_idx] -= 1.0 - scaled[small_idx]
+        (small if scaled[large_idx] < 1.0 else large).append(large_idx)
+    
+    # Whatever is left over is full up to rounding error
+    return probabilities, aliases
+
+def sample_alias(table):
+    """Draw an index from an alias table built by build_alias_table in O(1)"""
+    probabilities, aliases = table
+    idx = _PY_RNG.randrange(len(probabilities))
+    return idx if _PY_RNG.random() < probabilities[idx] else aliases[idx]
+
+def _to_epoch_seconds(dt):
+    """Seconds since 1970-01-01 for a naive datetime, taken as wall-clock time"""
+    return int(np.datetime64(dt, "s").astype(np.int64))
+
+def _uniform_batch(delta_seconds, size, rng):
+    """Uniform distribution across the entire range"""
+    return rng.uniform(0, delta_seconds, size)
+
+def _recent_heavy_batch(delta_seconds, size, rng):
+    """Bias toward more recent dates (70% land in the last 30% of the range)"""
+    return np.where(
+        rng.random(size) < 0.7,
+        rng.uniform(delta_seconds * 0.7, delta_seconds, size),
+        rng.uniform(0, delta_seconds, size)
+    )
+
+def _variable_batch(delta_seconds, size, rng):
+    """Clustered dates around random normal centers, with 10% uniform outliers"""
+    clustered = rng.normal(rng.uniform(0, delta_seconds, size), delta_seconds / rng.choice([2, 4, 6, 8], size))
+    return np.where(
+        rng.random(size) < 0.9,
+        np.clip(clustered, 0, delta_seconds),
+        rng.uniform(0, delta_seconds, size)
+    )
 
-def random_date(start_date, end_date, distribution="uniform", weekday_bias=True):
+# Offset pickers by distribution name, each drawing a whole batch of offsets in seconds
+_DIST_BATCH_FNS = {
+    "uniform": _uniform_batch,
+    "recent_heavy": _recent_heavy_batch,
+    "variable": _variable_batch
+}
+
+def random_epoch_seconds_batch(start_date, end_date, size, distribution="uniform", weekday_bias=True, rng=None):
     """
-    Generate a random date between start_date and end_date
+    Generate many random dates at once as epoch seconds
+    
+    All sampling and the weekday bias run on an int64 array of epoch seconds
+    (wall-clock time, like _to_epoch_seconds), so callers can keep doing date
+    arithmetic in NumPy and convert once with epoch_seconds_to_datetimes.
     
     Args:
         start_date: Earliest possible date
         end_date: Latest possible date
-        distribution: 'uniform' for even distribution, 
+        size: Number of dates to generate
+        distribution: 'uniform' for even distribution,
                      'recent_heavy' to bias toward recent dates,
                      'variable' for clustered dates with high variance
         weekday_bias: If True, dates are more likely to be weekdays than weekends
+        rng: numpy.random.Generator to draw from (defaults to the module stream)
     
     Returns:
-        Random datetime between start and end dates
+        int64 NumPy array of `size` epoch seconds between start and end dates
     """
-    delta = end_date - start_date
-    delta_seconds = delta.total_seconds()
-    
-    # First pick a random point in the time range
-    if distribution == "uniform":
-        # Uniform distribution across the entire range
-        random_second = random.uniform(0, delta_seconds)
-    elif distribution == "recent_heavy":
-        # Bias toward more recent dates (last 30% of range)
-        if random.random() < 0.7:  # 70% chance of recent date
-            recent_start = start_date + timedelta(seconds=delta_seconds * 0.7)
-            random_second = random.uniform((recent_start - start_date).total_seconds(), delta_seconds)
-        else:
-            random_second = random.uniform(0, delta_seconds)
-    elif distribution == "variable":
-        # More clustered random dates with occasional outliers
-        if random.random() < 0.9:  # 90% of dates follow a normal distribution
-            # Center of the normal distribution (mean) will be somewhere in the range
-            mean_point = random.uniform(0, delta_seconds)
-            # Standard deviation - higher values create more spread
-            std_dev = delta_seconds / random.choice([2, 4, 6, 8])
-            # Sample from normal distribution, but clamp to the valid range
-            random_second = np.random.normal(mean_point, std_dev)
-            random_second = max(0, min(random_second, delta_seconds))
-        else:  # 10% are uniform random (could be anywhere)
-            random_second = random.uniform(0, delta_seconds)
-    else:
+    if rng is None:
+        rng = _RNG
+    
+    pick_offsets = _DIST_BATCH_FNS.get(distribution)
+    if pick_offsets is None:
         raise ValueError(f"Unknown distribution: {distribution}")
     
-    # Get the initial random date
-    candidate_date = start_date + timedelta(seconds=random_second)
+    start_seconds = _to_epoch_seconds(start_date)
+    end_seconds = _to_epoch_seconds(end_date)
+    epoch_seconds = start_seconds + pick_offsets(end_seconds - start_seconds, size, rng).astype(np.int64)
     
-    # Apply weekday bias if requested
     if weekday_bias:
-        # Check if it's a weekend (5=Saturday, 6=Sunday)
-        is_weekend = candidate_date.weekday() >= 5
-        
-        if is_weekend:
-            # 70% chance to move to a weekday for weekend dates
-            if random.random() < 0.7:
-                # Decide whether to go forward or backward to find a weekday
-                if random.random() < 0.5:
-                    # Go forward to Monday (0-4 are weekdays)
-                    days_to_add = 7 - candidate_date.weekday()
-                    candidate_date += timedelta(days=days_to_add)
-                else:
-                    # Go backward to Friday
-                    days_to_subtract = candidate_date.weekday() - 4
-                    candidate_date -= timedelta(days=days_to_subtract)
-                
-                # Make sure we're still in range
-                if candidate_date < start_date:
-                    candidate_date = start_date
-                elif candidate_date > end_date:
-                    candidate_date = end_date
+        # 1970-01-01 was a Thursday, so (days + 3) % 7 gives Monday=0 ... Sunday=6
+        weekday = (epoch_seconds // 86400 + 3) % 7
+        # 70% chance to move weekend dates forward to Monday or back to Friday
+        move = (weekday >= 5) & (rng.random(size) < 0.7)
+        shift_days = np.where(rng.random(size) < 0.5, 7 - weekday, 4 - weekday)
+        shifted = np.clip(epoch_seconds + shift_days * 86400, start_seconds, end_seconds)
+        epoch_seconds = np.where(move, shifted, epoch_seconds)
+    
+    return epoch_seconds
+
+def epoch_seconds_to_datetimes(epoch_seconds, mask=None):
+    """
+    Convert an array of epoch seconds to naive datetimes in one shot
+    
+    Args:
+        epoch_seconds: Array of wall-clock epoch seconds
+        mask: Optional boolean array; positions where it is False become None
+    
+    Returns:
+        List of datetimes (or None where masked out)
+    """
+    dates = pd.to_datetime(epoch_seconds, unit="s").to_pydatetime().tolist()
+    if mask is None:
+        return dates
+    return [date if keep else None for date, keep in zip(dates, np.asarray(mask).tolist())]
+
+def pr_link_weight(commit_count):
+    """
+    Weight for linking another commit to a PR, based on how many it already has
+    
+    Prefers PRs with some commits but not too many, for realistic batching.
     
-    return candidate_date
+    Args:
+        commit_count: Number of commits already linked to the PR
+    
+    Returns:
+        Relative selection weight
+    """
+    if commit_count == 0:
+        return 3.0  # High chance for PRs with no commits
+    elif commit_count < 5:
+        return 5.0  # Higher chance for PRs with few commits
+    elif commit_count < 10:
+        return 2.0  # Medium chance
+    else:
+        return 0.5  # Low chance for PRs with many commits
 
-def long_tail_distribution(min_val, max_val, shape=2.0):
+def long_tail_distribution(min_val, max_val, shape=2.0, size=None, rng=None):
     """
     Generate a random number from a long-tail distribution.
     
@@ -197,28 +476,43 @@ def long_tail_distribution(min_val, max_val, shape=2.0):
         max_val: Maximum value
         shape: Parameter controlling the shape of the distribution
               Lower values create longer tails
+        size: If given, draw this many values at once as a NumPy array
+        rng: numpy.random.Generator for batched draws (defaults to the module stream)
               
     Returns:
-        A random number from the distribution
+        A random number from the distribution (or an array of `size` of them)
     """
-    # Pareto distribution for long tail
-    x = random.paretovariate(shape)
+    # Pareto distribution for long tail (NumPy's pareto is shifted by 1 against paretovariate)
+    if size is None:
+        x = _PY_RNG.paretovariate(shape)
+    else:
+        x = (rng if rng is not None else _RNG).pareto(shape, size) + 1
     
     # Scale to our desired range
     range_size = max_val - min_val
     scaled_val = min_val + (x / (x + 1)) * range_size
     
     # Cap at max_val
-    return min(scaled_val, max_val)
+    if size is None:
+        return min(scaled_val, max_val)
+    return np.minimum(scaled_val, max_val)
 
 # Developer characteristics generator
-def generate_developer_characteristics(num_developers):
+def generate_developer_characteristics(num_developers, rng=None):
     """
     Generate individual characteristics for developers to create variability
     
+    Args:
+        num_developers: Number of developers to generate
+        rng: numpy.random.Generator to draw from (defaults to the module stream);
+             pass get_worker_rng(i) when calling from parallel workers
+    
     Returns:
         Dictionary mapping developer names to their characteristics
     """
+    if rng is None:
+        rng = _RNG
+    
     dev_chars = {}
     
     for i in range(1, num_developers + 1):
@@ -226,37 +520,37 @@ def generate_developer_characteristics(num_developers):
         
         # Different developers have different productivity levels
         # This will affect how quickly they complete tasks
-        productivity = np.random.normal(1.0, 0.3)  # Mean 1.0, std dev 0.3
+        productivity = rng.normal(1.0, 0.3)  # Mean 1.0, std dev 0.3
         productivity = max(0.3, min(productivity, 2.0))  # Clamp to reasonable range
         
         # Quality of work - affects error rates, PR rejection, etc.
-        quality = np.random.normal(1.0, 0.25)
+        quality = rng.normal(1.0, 0.25)
         quality = max(0.4, min(quality, 1.7))
         
         # Activity level - how many contributions they make
-        activity = np.random.normal(1.0, 0.4)
+        activity = rng.normal(1.0, 0.4)
         activity = max(0.2, min(activity, 2.5))
         
         # Working hours - when they're most active
         # 0 = evenly distributed, 1 = mostly business hours, 2 = night owl
-        work_pattern = random.choice([0, 1, 1, 1, 2])  # Business hours most common
+        work_pattern = int(rng.choice([0, 1, 1, 1, 2]))  # Business hours most common
         
         # Specialization - some devs focus on specific types of tasks
         specializations = {
-            "bug_fixing": random.uniform(0.5, 1.5),
-            "features": random.uniform(0.5, 1.5),
-            "refactoring": random.uniform(0.5, 1.5),
-            "documentation": random.uniform(0.5, 1.5)
+            "bug_fixing": rng.uniform(0.5, 1.5),
+            "features": rng.uniform(0.5, 1.5),
+            "refactoring": rng.uniform(0.5, 1.5),
+            "documentation": rng.uniform(0.5, 1.5)
         }
         
         # Some developers tend to work on bigger or smaller tasks
-        task_size_preference = random.uniform(0.5, 1.5)
+        task_size_preference = rng.uniform(0.5, 1.5)
         
         # Tendency to pick up complex issues
-        complexity_preference = random.uniform(0.5, 1.5)
+        complexity_preference = rng.uniform(0.5, 1.5)
         
         # Review thoroughness - affects review time
-        review_thoroughness = random.uniform(0.5, 2.0)
+        review_thoroughness = rng.uniform(0.5, 2.0)
         
         # Store characteristics
         dev_chars[dev_name] = {
@@ -272,6 +566,900 @@ def generate_developer_characteristics(num_developers):
     
     return dev_chars
 
+def team_choices_for_repo(repo_name, size, rng):
+    """
+    Draw the team behind each of a repo's generated items, weighted by repo focus
+    
+    Args:
+        repo_name: Repository name (key into each team's repo_focus)
+        size: Number of items to draw a team for
+        rng: numpy.random.Generator to draw from
+    
+    Returns:
+        List of team names, one per item
+    """
+    team_names = list(TEAM_CONFIG.keys())
+    team_weights = np.array([TEAM_CONFIG[team_name]["repo_focus"][repo_name] for team_name in team_names])
+    team_idx = rng.choice(len(team_names), size=size, p=team_weights / team_weights.sum())
+    return np.array(team_names)[team_idx].tolist()
+
+# =============================================================================
+# ISSUE GENERATION
+# =============================================================================
+
+# Issue type distribution - some repos have different issue type distributions
+ISSUE_TYPES = ["Bug", "Task", "Story", "Epic"]
+ISSUE_TYPE_WEIGHTS = {
+    "frontend": [0.25, 0.35, 0.3, 0.1],  # More stories in frontend
+    "backend": [0.35, 0.4, 0.15, 0.1],  # More bugs in backend
+    "infra": [0.3, 0.45, 0.1, 0.15]  # More tasks and epics in infra
+}
+DEFAULT_ISSUE_WEIGHTS = [0.3, 0.4, 0.2, 0.1]
+
+# Open statuses have more variation than closed ones
+CLOSED_STATUS_OPTIONS = ["Done", "Resolved"]
+OPEN_STATUS_OPTIONS = ["To Do", "In Progress", "In Review", "Blocked", "In Testing"]
+OPEN_STATUS_WEIGHTS = [0.2, 0.4, 0.2, 0.1, 0.1]
+RESOLUTION_OPTIONS = ["Fixed", "Done", "Won't Fix", "Duplicate", "Cannot Reproduce"]
+
+# Priority with more variability by issue type
+PRIORITY_OPTIONS = ["Highest", "High", "Medium", "Low", "Lowest"]
+DEFAULT_PRIORITY_WEIGHTS = [0.1, 0.2, 0.4, 0.2, 0.1]
+PRIORITY_WEIGHTS_BY_TYPE = {
+    "Bug": [0.2, 0.3, 0.3, 0.1, 0.1],  # Bugs tend to be higher priority
+    "Epic": [0.15, 0.25, 0.35, 0.15, 0.1]  # Epics tend to be more balanced
+}
+
+# Number of labels/components follow a more realistic distribution
+NUM_LABELS_DIST = [0, 1, 1, 2, 2, 2, 3, 3, 4]  # More weight to 1-3 labels
+NUM_COMPONENTS_DIST = [0, 0, 1, 1, 1, 1, 2, 2, 3]  # More weight to 1-2 components
+
+# Story points (Fibonacci sequence common in Agile), one row per complexity tier
+STORY_POINT_TIERS = np.array([
+    [0.5, 1, 2, 3],  # complexity < 0.8
+    [2, 3, 5, 8],  # complexity < 1.2
+    [5, 8, 13, 21]  # everything more complex
+])
+
+# Building blocks for more varied issue titles
+ISSUE_TITLE_PREFIXES = ["Add", "Fix", "Update", "Implement", "Refactor", "Optimize", "Remove", "Investigate", "Improve"]
+ISSUE_TITLE_COMPONENTS = ["functionality", "feature", "component", "module", "integration", "API", "UI element", "workflow", "process"]
+BUG_TITLE_VERBS = ["Fix", "Address", "Resolve"]
+BUG_TITLE_PHRASES = ["issue with", "bug in", "problem with"]
+
+# Labels and components an issue can be tagged with
+ISSUE_LABELS = ["backend", "frontend", "security", "performance", "ux", "documentation",
+                "tech-debt", "feature", "enhancement", "critical", "accessibility"]
+ISSUE_COMPONENTS = ["API", "UI", "Database", "Authentication", "Reporting", "Infrastructure",
+                    "Frontend", "Backend", "Testing", "Documentation", "Deployment", "Mobile"]
+
+def compute_author_weights(soa, issue_type, complexity_factor):
+    """
+    Weight every member of a team for authoring an issue
+    
+    Works on the whole team at once using its struct-of-arrays characteristics:
+    activity level, scaled by the specialization matching the issue type and by
+    how well each member's complexity preference fits the issue.
+    
+    Args:
+        soa: Team entry of the struct-of-arrays view built in generate_mock_data
+        issue_type: Issue type ("Bug", "Task", "Story" or "Epic")
+        complexity_factor: Complexity of the issue (1.0 = average)
+    
+    Returns:
+        NumPy array of unnormalized weights, one per team member
+    """
+    # Adjust based on specialization for this issue type
+    if issue_type == "Bug":
+        specialization = soa["bug_fix"]
+    elif issue_type == "Epic":
+        specialization = soa["features"]
+    else:
+        specialization = 1.0
+    
+    # Base on activity level, then consider complexity preference
+    return soa["activity"] * specialization * (1 + (complexity_factor - 1) * (soa["complexity_pref"] - 1))
+
+def build_issues_for_repo(args):
+    """
+    Build every issue for a single repository
+    
+    Runs in a multiprocessing.Pool worker, so it only touches what it is handed
+    and returns a single DataFrame with one column per Issue field (cheap to
+    pickle back to the parent) rather than mongoengine Documents.
+    
+    Args:
+        args: Tuple of (repo_idx, repo_name, rng, repo_complexity,
+              author_work_patterns, team_soa) where rng is the worker's own
+              numpy.random.Generator (see get_worker_rng) and
+              author_work_patterns holds every developer's work pattern code
+              indexed by author id
+    
+    Returns:
+        DataFrame of issues for the repository, keyed by MongoDB field name
+    """
+    repo_idx, repo_name, rng, repo_complexity, author_work_patterns, team_soa = args
+    num_issues = ISSUES_PER_REPO
+    
+    # Forked workers inherit identical _PY_RNG state - reseed it from the worker stream
+    _PY_RNG.seed(int(rng.integers(2**63)))
+    
+    project_key = PROJECT_KEYS[repo_name]
+    repo_path = f"{ORG_NAME}/{repo_name}"
+    
+    # Draw every per-issue random value for this repo in a few batched calls
+    # Issue complexity affects lead time
+    complexity_arr = np.clip(rng.normal(1.0, 0.5, num_issues) * repo_complexity, 0.2, 3.0)
+    
+    # Some issues have very long lead times (outliers, 5% of issues, 10-30 days);
+    # the rest vary with complexity around a 1-72 hour base
+    lead_outlier = rng.random(num_issues) < 0.05
+    lead_time_arr = np.where(
+        lead_outlier,
+        rng.integers(240, 721, num_issues),
+        (rng.integers(1, 73, num_issues) * complexity_arr).astype(int)
+    )
+    
+    # Updated date based on activity on the issue (mean of 3 updates), each update
+    # interval drawn from 1..max(2, lead_time // (updates + 1)) hours
+    num_updates_arr = np.maximum(1, rng.normal(3, 2, num_issues).astype(int))
+    update_upper = np.repeat(np.maximum(2, lead_time_arr // (num_updates_arr + 1)), num_updates_arr)
+    update_draws = (rng.random(update_upper.size) * update_upper).astype(int) + 1
+    update_offsets = np.concatenate(([0], np.cumsum(num_updates_arr)[:-1]))
+    update_hours_arr = np.add.reduceat(update_draws, update_offsets)
+    
+    # Some issues are still open - more complex issues less likely to be closed
+    is_closed_arr = rng.random(num_issues) > (0.3 + 0.1 * complexity_arr)
+    
+    # Some closed issues (10%) are reopened and closed again
+    reopen_hours_arr = np.where(rng.random(num_issues) < 0.1, rng.integers(24, 121, num_issues), 0)
+    
+    # 70% of issues have due dates, mean of 14 days after creation (std dev of 7)
+    has_due_arr = rng.random(num_issues) > 0.3
+    due_days_arr = np.maximum(1, rng.normal(14, 7, num_issues).astype(int))
+    
+    issue_type_arr = rng.choice(
+        ISSUE_TYPES, size=num_issues, p=ISSUE_TYPE_WEIGHTS.get(repo_name, DEFAULT_ISSUE_WEIGHTS)
+    )
+    
+    # Status and resolution based on whether the issue is closed
+    status_arr = np.where(
+        is_closed_arr,
+        rng.choice(CLOSED_STATUS_OPTIONS, size=num_issues),
+        rng.choice(OPEN_STATUS_OPTIONS, size=num_issues, p=OPEN_STATUS_WEIGHTS)
+    )
+    resolution_arr = rng.choice(RESOLUTION_OPTIONS, size=num_issues)
+    
+    # Priority weights depend on the issue type
+    priority_arr = rng.choice(PRIORITY_OPTIONS, size=num_issues, p=DEFAULT_PRIORITY_WEIGHTS)
+    for weighted_type, type_weights in PRIORITY_WEIGHTS_BY_TYPE.items():
+        type_mask = issue_type_arr == weighted_type
+        priority_arr[type_mask] = rng.choice(PRIORITY_OPTIONS, size=type_mask.sum(), p=type_weights)
+    
+    num_labels_arr = rng.choice(NUM_LABELS_DIST, size=num_issues)
+    num_components_arr = rng.choice(NUM_COMPONENTS_DIST, size=num_issues)
+    
+    # Sample labels/components without replacement in bulk: argsort of uniform noise gives
+    # every row an independent random ordering, and each row keeps its first num_* entries
+    label_order_arr = np.array(ISSUE_LABELS)[np.argsort(rng.random((num_issues, len(ISSUE_LABELS))), axis=1)]
+    component_order_arr = np.array(ISSUE_COMPONENTS)[
+        np.argsort(rng.random((num_issues, len(ISSUE_COMPONENTS))), axis=1)
+    ]
+    
+    # Sprint with variable naming patterns and some issues not in sprints (75% in a sprint)
+    in_sprint_arr = rng.random(num_issues) > 0.25
+    sprint_pattern_arr = rng.integers(0, 3, num_issues)
+    sprint_number_arr = rng.integers(10, 41, num_issues)
+    sprint_year_arr = rng.integers(2023, 2025, num_issues)
+    sprint_week_arr = rng.integers(1, 27, num_issues)
+    sprint_quarter_arr = rng.integers(1, 5, num_issues)
+    sprint_quarter_number_arr = rng.integers(1, 14, num_issues)
+    
+    # Story points for 75% of stories, tasks and bugs, weighted by complexity
+    has_points_arr = np.isin(issue_type_arr, ["Story", "Task", "Bug"]) & (rng.random(num_issues) > 0.25)
+    story_points_arr = STORY_POINT_TIERS[np.digitize(complexity_arr, [0.8, 1.2]), rng.integers(0, 4, num_issues)]
+    
+    # Epic link for 60% of non-epics
+    has_epic_arr = (issue_type_arr != "Epic") & (rng.random(num_issues) > 0.4)
+    epic_num_arr = rng.integers(1, 21, num_issues)
+    
+    # Title parts; the subject picks one of the issue's components when it has any
+    bug_verb_arr = rng.choice(BUG_TITLE_VERBS, size=num_issues)
+    bug_phrase_arr = rng.choice(BUG_TITLE_PHRASES, size=num_issues)
+    title_prefix_arr = rng.choice(ISSUE_TITLE_PREFIXES, size=num_issues)
+    title_component_arr = rng.choice(ISSUE_TITLE_COMPONENTS, size=num_issues)
+    title_subject_pick_arr = rng.random(num_issues)
+    
+    # Issues are assigned based on repo focus: first pick each issue's team
+    team_name_arr = team_choices_for_repo(repo_name, num_issues, rng)
+    
+    # Base comment count (mean of 5), scaled per row by complexity and issue type
+    comment_base_arr = rng.normal(5, 4, num_issues).astype(int)
+    
+    # Per-issue comment factor: more complex issues tend to have more comments, and bugs
+    # (more back-and-forth) and epics (more discussion) more than other types
+    comment_factor_arr = complexity_arr * np.select(
+        [issue_type_arr == "Bug", issue_type_arr == "Epic"], [1.2, 1.5], default=1.0
+    )
+    
+    # Plain Python lists are much cheaper to index than NumPy arrays in the loop below
+    complexity_list = complexity_arr.tolist()
+    issue_type_list = issue_type_arr.tolist()
+    num_labels_arr = num_labels_arr.tolist()
+    num_components_arr = num_components_arr.tolist()
+    label_order_arr = label_order_arr.tolist()
+    component_order_arr = component_order_arr.tolist()
+    in_sprint_arr = in_sprint_arr.tolist()
+    sprint_pattern_arr = sprint_pattern_arr.tolist()
+    sprint_number_arr = sprint_number_arr.tolist()
+    sprint_year_arr = sprint_year_arr.tolist()
+    sprint_week_arr = sprint_week_arr.tolist()
+    sprint_quarter_arr = sprint_quarter_arr.tolist()
+    sprint_quarter_number_arr = sprint_quarter_number_arr.tolist()
+    bug_verb_arr = bug_verb_arr.tolist()
+    bug_phrase_arr = bug_phrase_arr.tolist()
+    title_prefix_arr = title_prefix_arr.tolist()
+    title_component_arr = title_component_arr.tolist()
+    title_subject_pick_arr = title_subject_pick_arr.tolist()
+    
+    # Random dates with more clustering and variability, weighted toward weekdays.
+    # All date arithmetic stays in int64 epoch seconds until the DataFrame is built
+    created_secs = random_epoch_seconds_batch(
+        SIMULATION_START_DATE, SIMULATION_END_DATE, num_issues, "variable", weekday_bias=True, rng=rng
+    )
+    
+    # Add realistic time of day based on the work pattern of a random developer:
+    # draw one hour per issue from each pattern's distribution, then keep the
+    # one matching the developer
+    work_pattern_arr = author_work_patterns[rng.integers(len(author_work_patterns), size=num_issues)]
+    hour_arr = np.choose(
+        work_pattern_arr, [random_hours_batch(pattern, num_issues, rng) for pattern in WORK_PATTERNS]
+    )
+    
+    # Only the values that depend on row-level choices are built in the loop; everything
+    # else becomes a DataFrame column straight from the arrays above
+    title_col = []
+    author_col = []
+    assignee_col = []
+    labels_col = []
+    components_col = []
+    sprint_col = []
+    
+    for i in progress_range(num_issues, f"Issues for {repo_name}", position=repo_idx):
+        complexity_factor = complexity_list[i]
+        issue_type = issue_type_list[i]
+        
+        # Different issue labels & components with more variability
+        labels = label_order_arr[i][:num_labels_arr[i]]
+        components = component_order_arr[i][:num_components_arr[i]]
+        
+        # Different sprint naming patterns
+        if not in_sprint_arr[i]:
+            sprint = None
+        elif sprint_pattern_arr[i] == 0:
+            sprint = f"Sprint {sprint_number_arr[i]}"
+        elif sprint_pattern_arr[i] == 1:
+            sprint = f"Sprint {sprint_year_arr[i]}-{sprint_week_arr[i]}"
+        else:
+            sprint = f"Q{sprint_quarter_arr[i]}-Sprint-{sprint_quarter_number_arr[i]}"
+        
+        # Assign based on repo focus and individual characteristics
+        # First select a team based on repo focus
+        team_name = team_name_arr[i]
+        
+        # Then select team members with bias based on issue characteristics
+        soa = team_soa[team_name]
+        team_members = soa["members"]
+        
+        # Weighted selection of author based on activity level and specialization
+        author_weights = compute_author_weights(soa, issue_type, complexity_factor)
+        
+        # Pick by bisecting a uniform draw into the cumulative weights (no need to normalize)
+        cum_weights = np.cumsum(author_weights)
+        if cum_weights[-1] > 0:
+            author = str(team_members[np.searchsorted(cum_weights, rng.random() * cum_weights[-1], side="right")])
+        else:
+            author = str(rng.choice(team_members))
+        
+        # Assignee is sometimes different, sometimes the same, sometimes null
+        if _PY_RNG.random() > 0.2:  # 80% of issues have assignees
+            if _PY_RNG.random() > 0.3:  # 70% of assigned issues go to a different person
+                assignees = team_members[team_members != author]
+                if assignees.size:
+                    assignee = str(rng.choice(assignees))
+                else:
+                    assignee = author
+            else:
+                assignee = author
+        else:
+            assignee = None
+        
+        # Create more varied issue titles from the pre-sampled parts
+        if components:
+            title_subject = components[int(title_subject_pick_arr[i] * len(components))]
+        else:
+            title_subject = title_component_arr[i]
+        
+        if issue_type == "Bug":
+            title = f"{issue_type}: {bug_verb_arr[i]} {bug_phrase_arr[i]} {title_subject} in {repo_name}"
+        else:
+            title = f"{issue_type}: {title_prefix_arr[i]} {title_subject} for {repo_name}"
+        
+        title_col.append(title)
+        author_col.append(author)
+        assignee_col.append(assignee)
+        labels_col.append(labels)
+        components_col.append(components)
+        sprint_col.append(sprint)
+    
+    # Issue IDs/keys in Jira format
+    issue_ids = np.arange(1, num_issues + 1) + repo_idx * ISSUES_PER_REPO
+    issue_keys = np.char.add(f"{project_key}-", issue_ids.astype(str))
+    
+    # Replace the hour, minute, and second while keeping the date
+    created_secs = (created_secs - created_secs % 86400 + hour_arr * 3600
+                    + rng.integers(0, 60, num_issues) * 60 + rng.integers(0, 60, num_issues))
+    
+    # Updated date follows the issue's activity; closed date adds the variable lead
+    # time (plus any reopen time) for closed issues only
+    updated_secs = created_secs + update_hours_arr * 3600
+    closed_secs = created_secs + (lead_time_arr + reopen_hours_arr) * 3600
+    due_secs = created_secs + due_days_arr * 86400
+    
+    return pd.DataFrame({
+        "_id": issue_keys,
+        "issue_id": issue_ids,
+        "project_key": project_key,
+        "repo": repo_path,
+        "title": title_col,
+        "description": [
+            f"This is a mock description for issue #{i} in {repo_name}.\n\nSteps to reproduce:\n1. Step one\n2. Step two\n3. Step three"
+            for i in range(num_issues)
+        ],
+        "issue_type": issue_type_arr,
+        "author": author_col,
+        "assignee": assignee_col,
+        "created_at": pd.to_datetime(created_secs, unit="s"),
+        "updated_at": pd.to_datetime(updated_secs, unit="s"),
+        "closed_at": pd.to_datetime(closed_secs, unit="s").where(is_closed_arr),
+        "due_date": pd.to_datetime(due_secs, unit="s").where(has_due_arr),
+        "status": status_arr,
+        "resolution": np.where(is_closed_arr, resolution_arr, None),
+        "priority": priority_arr,
+        "comment_count": np.maximum(0, (comment_base_arr * comment_factor_arr).astype(int)),
+        "labels": labels_col,
+        "components": components_col,
+        "sprint": sprint_col,
+        "story_points": np.where(has_points_arr, story_points_arr, np.nan),
+        "epic_link": np.where(has_epic_arr, np.char.add(f"{project_key}-", epic_num_arr.astype(str)), None)
+    })
+
+# =============================================================================
+# COMMIT GENERATION
+# =============================================================================
+
+def generate_commit_fields(num_commits, num_clusters, rng):
+    """
+    Draw the numeric fields of one repo's commits as NumPy arrays
+    
+    Commit dates come in clusters to simulate real development patterns: each
+    development "burst" has a random center, a size (how many commits it holds)
+    and a spread in hours (how spread out in time it is).
+    
+    Args:
+        num_commits: Number of commits to generate
+        num_clusters: Number of development bursts
+        rng: numpy.random.Generator to draw from
+    
+    Returns:
+        Dictionary of arrays with one entry per commit: "day_seconds" (epoch seconds
+        of the commit date with a random minute and second, but no hour yet),
+        "additions_base", "deletions_base" and "files_base" (sizes before the
+        author's size preference is applied), plus "hour_pools", one array of
+        hours per work pattern
+    """
+    start_seconds = _to_epoch_seconds(SIMULATION_START_DATE)
+    end_seconds = _to_epoch_seconds(SIMULATION_END_DATE)
+    
+    # Draw all clusters at once
+    center_seconds = random_epoch_seconds_batch(
+        SIMULATION_START_DATE, SIMULATION_END_DATE, num_clusters, "uniform", rng=rng
+    )
+    cluster_sizes = np.maximum(1, rng.normal(
+        num_commits / num_clusters, num_commits / (num_clusters * 3), num_clusters
+    ).astype(int))
+    cluster_spreads = rng.integers(1, 73, num_clusters)
+    
+    # Assign every commit to a cluster up front. Repeatedly picking a cluster weighted
+    # by its remaining size until it is depleted is the same as shuffling a pool that
+    # holds each cluster index once per commit in it. Commits beyond the end of the
+    # pool (all clusters depleted) fall back to a uniform random date
+    cluster_pool = rng.permutation(np.repeat(np.arange(num_clusters), cluster_sizes))
+    cluster_idx = np.full(num_commits, -1)
+    cluster_idx[:cluster_pool.size] = cluster_pool[:num_commits]
+    in_cluster = cluster_idx >= 0
+    cluster_idx = np.where(in_cluster, cluster_idx, 0)
+    
+    # Generate dates within the clusters: offset from the cluster center by
+    # 0.3 x the cluster spread per standard deviation, capped at the spread
+    spread_hours = cluster_spreads[cluster_idx]
+    time_offset = np.clip(rng.standard_normal(num_commits) * spread_hours * 0.3, -spread_hours, spread_hours)
+    clustered_seconds = center_seconds[cluster_idx] + time_offset * 3600
+    
+    # Ensure dates are within simulation range and apply weekday bias directly
+    # (70% chance to move weekend commits to the previous Friday or next Monday)
+    clustered_seconds = np.clip(clustered_seconds, start_seconds, end_seconds)
+    weekday = (clustered_seconds // 86400 + 3) % 7
+    move = (weekday >= 5) & (rng.random(num_commits) < 0.7)
+    shift_days = np.where(rng.random(num_commits) < 0.5, 7 - weekday, 4 - weekday)
+    clustered_seconds = np.where(move, clustered_seconds + shift_days * 86400, clustered_seconds)
+    
+    fallback_seconds = random_epoch_seconds_batch(
+        SIMULATION_START_DATE, SIMULATION_END_DATE, num_commits, "uniform", weekday_bias=True, rng=rng
+    )
+    day_seconds = np.where(in_cluster, clustered_seconds, fallback_seconds).astype(np.int64)
+    
+    # Truncate to midnight and add a random minute and second; the hour depends on
+    # the author's work pattern, so each commit takes it from the matching pool
+    day_seconds = day_seconds - day_seconds % 86400 + rng.integers(0, 3600, num_commits)
+    
+    return {
+        "day_seconds": day_seconds,
+        # Long-tail additions/deletions and a file count with a mean of 3
+        "additions_base": long_tail_distribution(3, 300, shape=1.2, size=num_commits, rng=rng),
+        "deletions_base": long_tail_distribution(0, 100, shape=1.5, size=num_commits, rng=rng),
+        "files_base": rng.normal(3, 2, num_commits),
+        "hour_pools": {
+            pattern: random_hours_batch(pattern, num_commits, rng) for pattern in HOUR_DISTRIBUTIONS
+        }
+    }
+
+def build_commits_for_repo(args):
+    """
+    Build every commit for a single repository
+    
+    Runs in a multiprocessing.Pool worker like build_issues_for_repo, so it only
+    touches what it is handed and returns plain documents.
+    
+    Args:
+        args: Tuple of (repo_idx, repo_name, rng, pr_ids, pr_authors_by_id,
+              linked_issue_key, members_by_team, team_soa) where rng is the
+              worker's own numpy.random.Generator and pr_authors_by_id covers
+              the repo's PRs
+    
+    Returns:
+        List of raw Commit documents (dicts in MongoDB form)
+    """
+    (repo_idx, repo_name, rng, pr_ids, pr_authors_by_id, linked_issue_key,
+     members_by_team, team_soa) = args
+    
+    # Forked workers inherit identical _PY_RNG state - reseed it from the worker stream
+    _PY_RNG.seed(int(rng.integers(2**63)))
+    _random = _PY_RNG.random
+    _randrange = _PY_RNG.randrange
+    
+    repo_path = f"{ORG_NAME}/{repo_name}"
+    
+    # Commit author alias tables keyed by (team name, linked PR author)
+    author_alias_tables = {}
+    
+    # Per-member work pattern and size preference of every team, as plain lists
+    # indexed like the team's members (the alias tables return member indices)
+    work_patterns_by_team = {
+        team_name: [WORK_PATTERNS[code] for code in soa["work_pattern"].tolist()]
+        for team_name, soa in team_soa.items()
+    }
+    size_prefs_by_team = {team_name: soa["task_size_pref"].tolist() for team_name, soa in team_soa.items()}
+    
+    # Commit messages are one of a few fixed styles with an optional reference prefix,
+    # so build each prefixed variant once instead of formatting a string per commit
+    num_message_styles = len(message_styles)
+    issue_prefixed_messages = (
+        [f"[{linked_issue_key}] {content}" for content in message_styles] if linked_issue_key else None
+    )
+    pr_prefixed_messages = {}
+    
+    # Per-commit numeric fields (dates, base sizes, hour pools) drawn as arrays;
+    # only the PR link and author picks, which depend on earlier commits, stay per row
+    commit_fields = generate_commit_fields(COMMITS_PER_REPO, _PY_RNG.randint(30, 100), rng)
+    committed_day_dates = epoch_seconds_to_datetimes(commit_fields["day_seconds"])
+    additions_base_arr = commit_fields["additions_base"].tolist()
+    deletions_base_arr = commit_fields["deletions_base"].tolist()
+    files_base_arr = commit_fields["files_base"].tolist()
+    hour_pools = {pattern: hours.tolist() for pattern, hours in commit_fields["hour_pools"].items()}
+    
+    # Track commits assigned to each PR for realistic batching, along with the running
+    # cumulative sum of the PRs' link weights (every PR starts with no commits)
+    pr_commit_counts = [0] * len(pr_ids)
+    pr_cum_weights = np.cumsum(np.full(len(pr_ids), pr_link_weight(0)))
+    
+    # Team behind each commit, based on repo focus
+    team_name_arr = team_choices_for_repo(repo_name, COMMITS_PER_REPO, rng)
+    
+    # Filled by index rather than appended to, since the size is known up front
+    commits = [None] * COMMITS_PER_REPO
+    
+    for i in progress_range(COMMITS_PER_REPO, f"Commits for {repo_name}", position=repo_idx):
+        # Link to PR with variable patterns
+        # Some commits are not linked to any PR
+        if pr_ids and _random() < 0.8:
+            if _random() < 0.7:  # 70% chance to select by PR commit count for realistic batching
+                # Weighted pick: bisect a uniform draw into the cumulative weights
+                pr_idx = bisect.bisect(pr_cum_weights, _random() * pr_cum_weights[-1])
+            else:
+                pr_idx = _randrange(len(pr_ids))
+            linked_pr_id = pr_ids[pr_idx]
+            
+            # Increment commit count for this PR; when that moves it into another weight
+            # tier, shift the cumulative weights from this PR onwards by the difference
+            old_weight = pr_link_weight(pr_commit_counts[pr_idx])
+            pr_commit_counts[pr_idx] += 1
+            weight_delta = pr_link_weight(pr_commit_counts[pr_idx]) - old_weight
+            if weight_delta:
+                pr_cum_weights[pr_idx:] += weight_delta
+        else:
+            linked_pr_id = None
+        
+        # Assign author based on repo focus and individual characteristics
+        # First select a team based on repo focus
+        team_name = team_name_arr[i]
+        
+        # Then select team members with bias based on commit patterns
+        team_members = members_by_team[team_name]
+        
+        # For linked PRs, prefer the PR author
+        pr_author = pr_authors_by_id.get(linked_pr_id) if linked_pr_id else None
+        
+        # Weighted selection of author based on activity level and commit patterns.
+        # The weights only depend on the team and the PR author, so build an alias
+        # table the first time a combination shows up and reuse it afterwards
+        alias_key = (team_name, pr_author)
+        author_table = author_alias_tables.get(alias_key)
+        if author_table is None:
+            soa = team_soa[team_name]
+            # Base on activity level, softening its impact
+            author_weights = soa["activity"] * 0.5 + 0.5
+            # The PR author (if in this team) gets a higher weight
+            author_weights = np.where(soa["members"] == pr_author, author_weights * 3.0, author_weights)
+            author_table = build_alias_table(np.maximum(0.1, author_weights).tolist())  # Ensure positive weight
+            author_alias_tables[alias_key] = author_table
+        member_idx = sample_alias(author_table)
+        author = team_members[member_idx]
+        
+        # Add realistic hour of day based on the author's work pattern. The date is
+        # drawn up front from the commit's cluster (or the uniform fallback), the
+        # hour is one of the prebuilt hour offsets
+        work_pattern = work_patterns_by_team[team_name][member_idx]
+        committed_date = committed_day_dates[i] + HOUR_OFFSETS[hour_pools[work_pattern][i]]
+        
+        # Generate commit size with more variability
+        # Different developers have different commit size patterns
+        size_preference = size_prefs_by_team[team_name][member_idx]
+        
+        # Long-tail additions/deletions drawn up front,
+        # smaller or larger based on developer preference
+        additions = int(additions_base_arr[i] * size_preference)
+        deletions = int(deletions_base_arr[i] * size_preference)
+        files_changed = max(1, int(files_base_arr[i] * size_preference))
+        
+        # Commit message with proper issue/PR reference format [PROJECT-123],
+        # picked from the prefixed variants of the message styles
+        message_idx = _randrange(num_message_styles)
+        if issue_prefixed_messages:
+            # Include issue key reference
+            message = issue_prefixed_messages[message_idx]
+        elif linked_pr_id:
+            # Just PR reference if no issue, built the first time a PR shows up
+            pr_messages = pr_prefixed_messages.get(linked_pr_id)
+            if pr_messages is None:
+                pr_messages = [f"[PR-{linked_pr_id}] {content}" for content in message_styles]
+                pr_prefixed_messages[linked_pr_id] = pr_messages
+            message = pr_messages[message_idx]
+        else:
+            # No references
+            message = message_styles[message_idx]
+        
+        # Raw Commit document (linked_pr doesn't exist in the model)
+        commits[i] = {
+            "_id": f"{repo_path}-commit-{i}-{int(time.time())}",
+            "repo": repo_path,
+            "author": author,
+            "committed_at": committed_date,
+            "message": message,
+            "additions": additions,
+            "deletions": deletions,
+            "files_changed": files_changed
+        }
+    
+    return commits
+
+# =============================================================================
+# WORKFLOW RUN GENERATION
+# =============================================================================
+
+# Workflow types, more light CI runs than deployments
+WORKFLOW_TYPES = ["light_ci", "medium_test", "heavy_deployment"]
+WORKFLOW_TYPE_WEIGHTS = [0.5, 0.3, 0.2]
+
+# Deployments often happen in early morning or evening
+DEPLOY_HOURS = list(range(6, 9)) + list(range(17, 20))
+
+# Different workflow conclusions with variable success rates
+WORKFLOW_CONCLUSIONS = ["success", "failure", "cancelled", "timed_out"]
+
+# More realistic distribution of branches for runs not on a PR branch
+BRANCH_OPTIONS = (["main"] * 15 + ["master"] * 5 + ["develop"] * 8 + ["staging"] * 5 + ["release"] * 3
+                  + [f"feature-{n}" for n in range(5)])
+
+# Workflow name based on type and repo with more variation
+WORKFLOW_CATEGORIES = {
+    "CI": ["Build", "Test", "Lint", "Validate", "Verify"],
+    "Deploy": ["Deploy to Dev", "Deploy to Staging", "Deploy to Production", "Release"],
+    "Test": ["Unit Tests", "Integration Tests", "E2E Tests", "Acceptance Tests", "Performance Tests"],
+    "Checks": ["Security Scan", "Dependency Check", "Code Quality", "Coverage"]
+}
+WORKFLOW_CATEGORY_NAMES = list(WORKFLOW_CATEGORIES.keys())
+
+# Category weights by workflow type, as cumulative weights
+WORKFLOW_CATEGORY_CUM_WEIGHTS = {
+    "light_ci": list(accumulate([0.6, 0.1, 0.2, 0.1])),  # More CI for light workflows
+    "medium_test": list(accumulate([0.3, 0.1, 0.5, 0.1])),  # More Tests for medium workflows
+    "heavy_deployment": list(accumulate([0.2, 0.6, 0.1, 0.1]))  # More Deploy for heavy workflows
+}
+
+def build_workflow_runs_for_repo(args):
+    """
+    Build every workflow run for a single repository
+    
+    Runs in a multiprocessing.Pool worker like build_issues_for_repo, so it only
+    touches what it is handed and returns plain documents.
+    
+    Args:
+        args: Tuple of (repo_idx, repo_name, rng, pr_ids, run_ids) where rng is the
+              worker's own numpy.random.Generator and run_ids holds one unique ID
+              per run
+    
+    Returns:
+        List of raw WorkflowRun documents (dicts in MongoDB form)
+    """
+    repo_idx, repo_name, rng, pr_ids, run_ids = args
+    num_runs = WORKFLOW_RUNS_PER_REPO
+    
+    # Forked workers inherit identical _PY_RNG state - reseed it from the worker stream
+    _PY_RNG.seed(int(rng.integers(2**63)))
+    _random = _PY_RNG.random
+    _choice = _PY_RNG.choice
+    _randint = _PY_RNG.randint
+    _uniform = _PY_RNG.uniform
+    
+    repo_path = f"{ORG_NAME}/{repo_name}"
+    simulation_start_secs = _to_epoch_seconds(SIMULATION_START_DATE)
+    simulation_end_secs = _to_epoch_seconds(SIMULATION_END_DATE)
+    
+    # Create success rate trends over time to simulate improvement or degradation
+    success_rate_trend = _choice([
+        "improving",      # Success rate increases over time
+        "degrading",      # Success rate decreases over time
+        "stable",         # Success rate stays relatively stable
+        "fluctuating",    # Success rate goes up and down
+        "step_change"     # Success rate changes dramatically at some point
+    ])
+    
+    # For step change, decide when it happens
+    step_change_point = _uniform(0.3, 0.7)  # Between 30% and 70% through the timeline
+    
+    # Base success rates
+    if success_rate_trend == "improving":
+        start_success_rate = 0.6 + _uniform(0, 0.2)
+        end_success_rate = 0.8 + _uniform(0, 0.15)
+    elif success_rate_trend == "degrading":
+        start_success_rate = 0.8 + _uniform(0, 0.15)
+        end_success_rate = 0.6 + _uniform(0, 0.2)
+    elif success_rate_trend == "stable":
+        mid_rate = 0.75 + _uniform(-0.1, 0.1)
+        start_success_rate = end_success_rate = mid_rate
+    elif success_rate_trend == "fluctuating":
+        mid_rate = 0.75 + _uniform(-0.1, 0.1)
+        fluctuation = 0.1 + _uniform(0, 0.1)
+        start_success_rate = end_success_rate = mid_rate
+        # Fluctuation handled during run generation
+    else:  # step_change
+        if _random() < 0.5:  # 50% chance of improvement
+            start_success_rate = 0.65 + _uniform(-0.1, 0.1)
+            end_success_rate = 0.85 + _uniform(-0.05, 0.1)
+        else:  # 50% chance of degradation
+            start_success_rate = 0.85 + _uniform(-0.05, 0.1)
+            end_success_rate = 0.65 + _uniform(-0.1, 0.1)
+    
+    # Draw every per-run numeric field for this repo as arrays up front
+    # Random dates with weekday bias, as epoch seconds
+    created_secs = random_epoch_seconds_batch(
+        SIMULATION_START_DATE, SIMULATION_END_DATE, num_runs, "variable", weekday_bias=True, rng=rng
+    )
+    
+    # Execution time varies by workflow type with true long-tail distribution
+    # Different workflow types have different distributions
+    workflow_type_arr = rng.choice(WORKFLOW_TYPES, size=num_runs, p=WORKFLOW_TYPE_WEIGHTS)
+    is_light_arr = workflow_type_arr == "light_ci"
+    is_medium_arr = workflow_type_arr == "medium_test"
+    is_deploy_arr = workflow_type_arr == "heavy_deployment"
+    
+    # Add hour of day based on workflow type (deployments often during non-peak hours):
+    # deployments often happen in early morning or evening, regular CI typically
+    # follows work patterns
+    hour_arr = np.where(
+        is_deploy_arr,
+        rng.choice(DEPLOY_HOURS, size=num_runs),
+        random_hours_batch("business", num_runs, rng)
+    )
+    created_secs = (created_secs - created_secs % 86400 + hour_arr * 3600
+                    + rng.integers(0, 60, num_runs) * 60 + rng.integers(0, 60, num_runs))
+    
+    # Calculate where in the timeline each run falls (0 to 1)
+    timeline_position = (created_secs - simulation_start_secs) / (simulation_end_secs - simulation_start_secs)
+    
+    # Calculate success rate based on trend
+    if success_rate_trend == "improving" or success_rate_trend == "degrading":
+        success_rate_arr = start_success_rate + (end_success_rate - start_success_rate) * timeline_position
+    elif success_rate_trend == "fluctuating":
+        # Create a sine wave pattern with random phase
+        phase = rng.uniform(0, 6.28, num_runs)  # 0 to 2π
+        cycles = 3 + rng.uniform(0, 2, num_runs)  # Number of cycles over the time period
+        success_rate_arr = start_success_rate + 0.15 * np.sin(phase + cycles * 6.28 * timeline_position)
+    elif success_rate_trend == "step_change":
+        # Flat before the step change point, then a linear blend over 5% of the timeline
+        # for a bit of smoothing, then flat again
+        blend_factor = np.clip((timeline_position - step_change_point) / 0.05, 0, 1)
+        success_rate_arr = start_success_rate * (1 - blend_factor) + end_success_rate * blend_factor
+    else:  # stable
+        # Add small random variations to stable
+        success_rate_arr = start_success_rate + rng.uniform(-0.05, 0.05, num_runs)
+    
+    # Clamp to reasonable range
+    success_rate_arr = np.clip(success_rate_arr, 0.5, 0.98)
+    
+    # Simulate both fast and slow runner pickups with long tail distribution
+    pickup_delay_arr = long_tail_distribution(0.1, 1800, shape=1.2, size=num_runs, rng=rng)  # 0.1sec to 30min
+    
+    execution_time_arr = np.select(
+        [is_light_arr, is_medium_arr],
+        [
+            # Lighter CI jobs - mostly quick with occasional slowness
+            long_tail_distribution(15, 1800, shape=1.5, size=num_runs, rng=rng),  # 15sec to 30min
+            # Medium tests - wider range
+            long_tail_distribution(180, 3600, shape=1.3, size=num_runs, rng=rng)  # 3min to 60min
+        ],
+        # Heavy deployment jobs - long with high variability
+        long_tail_distribution(300, 7200, shape=1.1, size=num_runs, rng=rng)  # 5min to 2hrs
+    )
+    
+    # Convert the dates in one shot each
+    created_dates = epoch_seconds_to_datetimes(created_secs)
+    started_dates = epoch_seconds_to_datetimes(created_secs + pickup_delay_arr)
+    completed_dates = epoch_seconds_to_datetimes(created_secs + pickup_delay_arr + execution_time_arr)
+    
+    # Different workflow conclusions with variable success rates. Base weights on the
+    # current success rate: 70% of non-success is failure, 20% cancelled, 10% timeout.
+    # Each run's cumulative weights are [s, s + 0.7(1-s), s + 0.9(1-s), 1], so counting
+    # how many of them a uniform draw reaches is a row-wise searchsorted
+    failure_rate_arr = 1 - success_rate_arr
+    conclusion_cum_weights = np.stack([
+        success_rate_arr,
+        success_rate_arr + failure_rate_arr * 0.7,
+        success_rate_arr + failure_rate_arr * 0.9
+    ], axis=1)
+    conclusion_idx = (rng.random((num_runs, 1)) >= conclusion_cum_weights).sum(axis=1)
+    conclusion_arr = np.array(WORKFLOW_CONCLUSIONS)[conclusion_idx]
+    
+    # Workflow category by type, searchsorted into that type's cumulative weights
+    category_draws = rng.random(num_runs)
+    category_idx = np.empty(num_runs, dtype=np.int64)
+    for workflow_type, cum_weights in WORKFLOW_CATEGORY_CUM_WEIGHTS.items():
+        type_mask = workflow_type_arr == workflow_type
+        category_idx[type_mask] = np.searchsorted(
+            cum_weights, category_draws[type_mask] * cum_weights[-1], side="right"
+        )
+    workflow_category_arr = np.array(WORKFLOW_CATEGORY_NAMES)[category_idx]
+    
+    # Plain Python lists are much cheaper to index than NumPy arrays in the loop below
+    workflow_type_arr = workflow_type_arr.tolist()
+    conclusion_arr = conclusion_arr.tolist()
+    workflow_category_arr = workflow_category_arr.tolist()
+    pickup_delay_arr = pickup_delay_arr.tolist()
+    execution_time_arr = execution_time_arr.tolist()
+    
+    # Filled by index rather than appended to, since the size is known up front
+    workflows = [None] * num_runs
+    
+    for i in progress_range(num_runs, f"Workflow runs for {repo_name}", position=repo_idx):
+        workflow_type = workflow_type_arr[i]
+        conclusion = conclusion_arr[i]
+        pickup_delay = pickup_delay_arr[i]
+        execution_time = execution_time_arr[i]
+        created_date = created_dates[i]
+        started_date = started_dates[i]
+        completed_date = completed_dates[i]
+        
+        # More complex runs more likely to fail
+        if execution_time > 1800 and conclusion == "success":  # For runs over 30 minutes
+            if _random() < 0.3:  # 30% chance to override to failure
+                conclusion = "failure"
+        
+        # Different runner types with different reliability
+        runner_type = _choice(["GitHub-hosted", "self-hosted"])
+        if runner_type == "GitHub-hosted":
+            runner_name = _choice(["ubuntu-latest", "windows-latest", "macos-latest"])
+            
+            # Different OS runners have different reliability patterns
+            if runner_name == "windows-latest" and conclusion == "success":
+                if _random() < 0.15:  # Windows slightly less reliable
+                    conclusion = _choice(["failure", "timed_out"])
+        else:
+            runner_name = _choice(["custom-runner-1", "custom-runner-2", "custom-large-runner"])
+            
+            # Custom runners might have specific issues
+            if runner_name == "custom-runner-1" and conclusion == "success":
+                if _random() < 0.1:  # Slight reliability issues
+                    conclusion = "failure"
+        
+        # Link to PR - more variable by workflow and repo type
+        linked_pr_id = None
+        link_probability = 0.7  # Base probability
+        
+        # Frontend repo may have more workflow runs not linked to PRs
+        if repo_name == "frontend":
+            link_probability -= 0.1
+        
+        # Deployment workflows less likely to be directly linked to PRs
+        if workflow_type == "heavy_deployment":
+            link_probability -= 0.2
+        
+        if pr_ids and _random() < link_probability:
+            linked_pr_id = _choice(pr_ids)
+        
+        # Branch distribution - more realistic patterns
+        if linked_pr_id and _random() < 0.8:
+            # If linked to PR, use a feature branch name with different patterns
+            branch_patterns = [
+                f"feature/PR-{linked_pr_id}",
+                f"feature/{_choice(['add', 'fix', 'update'])}-{_choice(['auth', 'ui', 'api', 'docs'])}-{linked_pr_id}",
+                f"bugfix/issue-{_randint(100, 999)}",
+                f"user/{_choice(['dev', 'jsmith', 'apatterson'])}/{_choice(['feature', 'fix', 'refactor'])}-{_randint(1, 99)}"
+            ]
+            branch = _choice(branch_patterns)
+        else:
+            branch = _choice(BRANCH_OPTIONS)
+        
+        workflow_category = workflow_category_arr[i]
+        workflow_subtype = _choice(WORKFLOW_CATEGORIES[workflow_category])
+        
+        # Sometimes workflows have team names in them
+        if _random() < 0.3:
+            team_prefix = f"{_choice(list(TEAM_CONFIG.keys()))}: "
+        else:
+            team_prefix = ""
+        
+        workflow_name = f"{team_prefix}{repo_name.capitalize()} {workflow_category}: {workflow_subtype}"
+        
+        # Raw WorkflowRun document (linked_pr doesn't exist in the model so we're not storing it)
+        workflows[i] = {
+            # Use unique ID generation to avoid duplicates
+            "_id": run_ids[i],
+            "repo": repo_path,
+            "workflow_name": workflow_name,
+            "created_at": created_date,
+            "started_at": started_date,
+            "completed_at": completed_date,
+            "conclusion": conclusion,
+            "runner_name": runner_name,
+            "runner_type": runner_type,
+            "pickup_time_seconds": pickup_delay,
+            "execution_time_seconds": execution_time,
+            "branch": branch
+        }
+    
+    return workflows
+
 # =============================================================================
 # MAIN GENERATION FUNCTION
 # =============================================================================
@@ -282,9 +1470,26 @@ def generate_mock_data():
     print(f"Starting mock data generation at {datetime.now()}")
     print(f"Simulating an organization with {ORG_SIZE} members from {SIMULATION_START_DATE.date()} to {SIMULATION_END_DATE.date()}")
     
+    # Bind the stdlib RNG's methods to locals once; the generation loops below call
+    # them millions of times and this skips an attribute lookup per call
+    _random = _PY_RNG.random
+    _choice = _PY_RNG.choice
+    _randint = _PY_RNG.randint
+    _uniform = _PY_RNG.uniform
+    _shuffle = _PY_RNG.shuffle
+    
     # Initialize team productivity dictionary
     team_productivity = {}
     
+    # Switch off mongoengine's automatic index creation for the seeded collections
+    # before touching them, otherwise it builds every index on the first collection
+    # access (e.g. the deletes below) only for them to be dropped again
+    bulk_loaded_models = (Team, Repository, Issue, PullRequest, Commit, WorkflowRun)
+    auto_create_index_flags = {}
+    for model_cls in bulk_loaded_models:
+        auto_create_index_flags[model_cls] = model_cls._meta.get("auto_create_index", True)
+        model_cls._meta["auto_create_index"] = False
+    
     # Clear existing data - important to prevent duplicate key errors
     print("Clearing existing data...")
     try:
@@ -299,6 +1504,12 @@ def generate_mock_data():
         print(f"Warning when clearing data: {e}")
         # Continue anyway as the collections might not exist yet
     
+    # Drop secondary indexes on the bulk-loaded collections so inserts don't pay for
+    # index maintenance; they are rebuilt once at the end. Tradeoff: anything reading
+    # these collections while generation runs does so without indexes.
+    for model_cls in bulk_loaded_models:
+        model_cls._get_collection().drop_indexes()
+    
     # -------------------------------------------------------------------------
     # Generate developer characteristics for more realistic variability
     # -------------------------------------------------------------------------
@@ -311,13 +1522,20 @@ def generate_mock_data():
     print("Generating organization members...")
     authors = [f"dev{i}" for i in range(1, ORG_SIZE + 1)]
     
+    # Work pattern code of every developer, indexed by author id (position in authors)
+    author_work_patterns = np.array(
+        [dev_characteristics[author]["work_pattern"] for author in authors], dtype=np.int8
+    )
+    
     # -------------------------------------------------------------------------
     # Generate teams with variable sizes
     # -------------------------------------------------------------------------
     print("Generating teams with variable sizes...")
     teams = []
     team_member_map = {}  # Maps members to their team
-    remaining_authors = authors.copy()
+    # Reverse index of team_member_map, so member lookups inside the generation
+    # loops are a dict access instead of a scan over every organization member
+    members_by_team = {}
     
     # First pass: determine team sizes based on ranges
     total_allocated = 0
@@ -328,7 +1546,7 @@ def generate_mock_data():
     for team_name, team_info in TEAM_CONFIG.items():
         min_pct, max_pct = team_info["size_pct_range"]
         # Randomly select a percentage within the range
-        team_pct = random.uniform(min_pct, max_pct)
+        team_pct = _uniform(min_pct, max_pct)
         # Calculate team size based on percentage
         team_size = max(min_team_size, int(ORG_SIZE * team_pct))
         team_sizes[team_name] = team_size
@@ -340,7 +1558,7 @@ def generate_mock_data():
         # Distribute adjustment across teams proportionally
         team_names = list(team_sizes.keys())
         while adjustment_needed != 0:
-            team_to_adjust = random.choice(team_names)
+            team_to_adjust = _choice(team_names)
             if adjustment_needed > 0:
                 team_sizes[team_to_adjust] += 1
                 adjustment_needed -= 1
@@ -350,29 +1568,34 @@ def generate_mock_data():
                     adjustment_needed += 1
     
     # Second pass: create teams with the determined sizes
+    # Shuffle once and hand out contiguous slices - a random partition without
+    # repeated list.remove() calls
+    shuffled_authors = authors.copy()
+    _shuffle(shuffled_authors)
+    offset = 0
+    
     for i, (team_name, team_info) in enumerate(TEAM_CONFIG.items()):
         team_size = team_sizes[team_name]
         
         # Adjust for last team to use all remaining members
         if i == len(TEAM_CONFIG) - 1:
-            team_members = remaining_authors
+            team_members = shuffled_authors[offset:]
         else:
-            # Randomly select members for this team
-            team_members = random.sample(remaining_authors, team_size)
-            # Remove selected members from remaining pool
-            for member in team_members:
-                remaining_authors.remove(member)
+            # Take the next contiguous slice of the shuffled pool
+            team_members = shuffled_authors[offset:offset + team_size]
+            offset += team_size
         
-        # Track which team each member belongs to
+        # Track which team each member belongs to, in both directions
         for member in team_members:
             team_member_map[member] = team_name
+        members_by_team[team_name] = team_members
             
         # Store team productivity and quality factors for later use
         team_productivity[team_name] = team_info["productivity_factor"]
         
         # Create team document
-        created_date = SIMULATION_START_DATE - timedelta(days=random.randint(30, 365))
-        updated_date = created_date + timedelta(days=random.randint(1, 30))
+        created_date = SIMULATION_START_DATE - timedelta(days=_randint(30, 365))
+        updated_date = created_date + timedelta(days=_randint(1, 30))
         
         teams.append(Team(
             team_id=i + 1,
@@ -384,11 +1607,27 @@ def generate_mock_data():
         ))
     
     # Batch insert teams
-    Team.objects.insert(teams)
+    inserted_teams = fast_bulk_insert(Team, teams)
     print(f"Generated {len(teams)} teams with more variable sizes:")
     for team_name, size in team_sizes.items():
         print(f"  - {team_name}: {size} members ({size/ORG_SIZE*100:.1f}%)")
     
+    # Struct-of-arrays view of each team: member names plus one NumPy vector per
+    # developer characteristic, so author weights are a few vector ops per row
+    # instead of dict lookups per member
+    team_soa = {}
+    for team_name, members in members_by_team.items():
+        member_chars = [dev_characteristics[member] for member in members]
+        team_soa[team_name] = {
+            "members": np.array(members),
+            "activity": np.array([char["activity"] for char in member_chars]),
+            "bug_fix": np.array([char["specializations"]["bug_fixing"] for char in member_chars]),
+            "features": np.array([char["specializations"]["features"] for char in member_chars]),
+            "complexity_pref": np.array([char["complexity_preference"] for char in member_chars]),
+            "task_size_pref": np.array([char["task_size_preference"] for char in member_chars]),
+            "work_pattern": np.array([char["work_pattern"] for char in member_chars], dtype=np.int8)
+        }
+    
     # -------------------------------------------------------------------------
     # Generate repositories
     # -------------------------------------------------------------------------
@@ -396,8 +1635,8 @@ def generate_mock_data():
     repositories = []
     
     for i, repo_name in enumerate(REPOS):
-        created_date = SIMULATION_START_DATE - timedelta(days=random.randint(30, 365))
-        updated_date = created_date + timedelta(days=random.randint(1, 30))
+        created_date = SIMULATION_START_DATE - timedelta(days=_randint(30, 365))
+        updated_date = created_date + timedelta(days=_randint(1, 30))
         
         repositories.append(Repository(
             repo_id=i + 1,
@@ -409,298 +1648,48 @@ def generate_mock_data():
         ))
     
     # Batch insert repositories
-    Repository.objects.insert(repositories)
+    inserted_repositories = fast_bulk_insert(Repository, repositories)
     print(f"Generated {len(repositories)} repositories")
     
     # -------------------------------------------------------------------------
     # Generate issues (Jira format) with more variable lead times
     # -------------------------------------------------------------------------
     print(f"Generating issues ({ISSUES_PER_REPO} per repo) with variable lead times...")
-    all_issues = []
-    
-    # Mapping from issue ID to issue key for later reference
-    issue_id_to_key = {}
     
     # Generate issue complexity distribution - some repos have more complex issues
     repo_complexity = {
-        "frontend": random.uniform(0.8, 1.2),
-        "backend": random.uniform(0.8, 1.2),
-        "infra": random.uniform(0.8, 1.2)
+        "frontend": _uniform(0.8, 1.2),
+        "backend": _uniform(0.8, 1.2),
+        "infra": _uniform(0.8, 1.2)
     }
     
-    for repo_idx, repo_name in enumerate(REPOS):
-        project_key = PROJECT_KEYS[repo_name]
-        repo_path = f"{ORG_NAME}/{repo_name}"
-        
-        for i in tqdm(range(ISSUES_PER_REPO), desc=f"Issues for {repo_name}"):
-            # Random dates with more clustering and variability, weighted toward weekdays
-            created_date = random_date(SIMULATION_START_DATE, SIMULATION_END_DATE, "variable", weekday_bias=True)
-            
-            # Add realistic time of day based on developer work patterns
-            author = random.choice(authors)  # Ensure 'author' is initialized
-            dev_char = dev_characteristics.get(author, {})
-            work_pattern = "business"
-            if "work_pattern" in dev_char:
-                if dev_char["work_pattern"] == 0:
-                    work_pattern = "distributed"
-                elif dev_char["work_pattern"] == 2:
-                    work_pattern = "night_owl"
-            
-            # Get a random hour based on the work pattern
-            hour = random_hour_of_day(work_pattern)
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            
-            # Replace the hour, minute, and second while keeping the date
-            created_date = created_date.replace(hour=hour, minute=minute, second=second)
-            
-            # Issue complexity affects lead time
-            complexity_factor = np.random.normal(1.0, 0.5) * repo_complexity[repo_name]
-            complexity_factor = max(0.2, min(complexity_factor, 3.0))  # Clamp to reasonable range
-            
-            # Some issues have very long lead times (outliers)
-            lead_time_outlier = random.random() < 0.05  # 5% of issues
-            
-            # Calculate lead time with high variability
-            if lead_time_outlier:
-                # Outlier lead time - much longer
-                lead_time_hours = random.randint(240, 720)  # 10-30 days
-            else:
-                # Normal lead time with variability based on complexity
-                base_lead_time = random.randint(1, 72)  # 1-72 hours base
-                lead_time_hours = int(base_lead_time * complexity_factor)
-            
-            # Updated date based on activity on the issue
-            num_updates = max(1, int(np.random.normal(3, 2)))  # Mean of 3 updates
-            update_intervals = [random.randint(1, max(2, lead_time_hours // (num_updates + 1))) for _ in range(num_updates)]
-            updated_date = created_date + timedelta(hours=sum(update_intervals))
-            
-            # Some issues are still open
-            is_closed = random.random() > (0.3 + 0.1 * complexity_factor)  # More complex issues less likely to be closed
-            
-            # Calculate closed date with variable lead time
-            if is_closed:
-                # Add some variability to closed dates
-                closed_date = created_date + timedelta(hours=lead_time_hours)
-                # Some issues are reopened and closed again
-                if random.random() < 0.1:  # 10% of closed issues
-                    closed_date += timedelta(hours=random.randint(24, 120))
-            else:
-                closed_date = None
-            
-            # Due dates more variable
-            if random.random() > 0.3:  # 70% of issues have due dates
-                # Due date relative to creation date
-                due_date_days = int(np.random.normal(14, 7))  # Mean of 14 days, std dev of 7
-                due_date_days = max(1, due_date_days)  # Minimum 1 day
-                due_date = created_date + timedelta(days=due_date_days)
-            else:
-                due_date = None
-            
-            # Issue type distribution - slightly more varied
-            issue_types = ["Bug", "Task", "Story", "Epic"]
-            issue_weights = [0.3, 0.4, 0.2, 0.1]
-            
-            # Some repos have different issue type distributions
-            if repo_name == "frontend":
-                issue_weights = [0.25, 0.35, 0.3, 0.1]  # More stories in frontend
-            elif repo_name == "backend":
-                issue_weights = [0.35, 0.4, 0.15, 0.1]  # More bugs in backend
-            elif repo_name == "infra":
-                issue_weights = [0.3, 0.45, 0.1, 0.15]  # More tasks and epics in infra
-                
-            issue_type = weighted_choice(issue_types, issue_weights)
-            
-            # Status based on whether it's closed
-            if is_closed:
-                status = random.choice(["Done", "Resolved"])
-            else:
-                # More variation in open statuses
-                status_options = ["To Do", "In Progress", "In Review", "Blocked", "In Testing"]
-                status_weights = [0.2, 0.4, 0.2, 0.1, 0.1]
-                status = weighted_choice(status_options, status_weights)
-            
-            # Resolution if closed
-            resolution = random.choice(["Fixed", "Done", "Won't Fix", "Duplicate", "Cannot Reproduce"]) if is_closed else None
-            
-            # Priority with more variability by team and issue type
-            priority_options = ["Highest", "High", "Medium", "Low", "Lowest"]
-            
-            # Default weights
-            priority_weights = [0.1, 0.2, 0.4, 0.2, 0.1]
-            
-            # Bugs tend to be higher priority
-            if issue_type == "Bug":
-                priority_weights = [0.2, 0.3, 0.3, 0.1, 0.1]
-            # Epics tend to be more balanced
-            elif issue_type == "Epic":
-                priority_weights = [0.15, 0.25, 0.35, 0.15, 0.1]
-                
-            priority = weighted_choice(priority_options, priority_weights)
-            
-            # Different issue labels & components with more variability
-            possible_labels = ["backend", "frontend", "security", "performance", "ux", "documentation", 
-                              "tech-debt", "feature", "enhancement", "critical", "accessibility"]
-            
-            # Number of labels follows a more realistic distribution
-            num_labels_dist = [0, 1, 1, 2, 2, 2, 3, 3, 4]  # More weight to 1-3 labels
-            num_labels = random.choice(num_labels_dist)
-            labels = random.sample(possible_labels, num_labels) if num_labels > 0 else []
-            
-            possible_components = ["API", "UI", "Database", "Authentication", "Reporting", "Infrastructure", 
-                                  "Frontend", "Backend", "Testing", "Documentation", "Deployment", "Mobile"]
-            
-            # Number of components follows a variable distribution
-            num_components_dist = [0, 0, 1, 1, 1, 1, 2, 2, 3]  # More weight to 1-2 components
-            num_components = random.choice(num_components_dist)
-            components = random.sample(possible_components, num_components) if num_components > 0 else []
-            
-            # Sprint with variable naming patterns and some issues not in sprints
-            if random.random() > 0.25:  # 75% in a sprint
-                # Different sprint naming patterns
-                sprint_patterns = [
-                    f"Sprint {random.randint(10, 40)}",
-                    f"Sprint {random.randint(2023, 2024)}-{random.randint(1, 26)}",
-                    f"{random.choice(['Q1', 'Q2', 'Q3', 'Q4'])}-Sprint-{random.randint(1, 13)}"
-                ]
-                sprint = random.choice(sprint_patterns)
-            else:
-                sprint = None
-            
-            # Story points with more variability (Fibonacci sequence common in Agile)
-            if issue_type in ["Story", "Task", "Bug"] and random.random() > 0.25:
-                story_point_options = [0.5, 1, 2, 3, 5, 8, 13, 21]
-                
-                # Weight by complexity
-                if complexity_factor < 0.8:
-                    story_points = random.choice([0.5, 1, 2, 3])
-                elif complexity_factor < 1.2:
-                    story_points = random.choice([2, 3, 5, 8])
-                else:
-                    story_points = random.choice([5, 8, 13, 21])
-            else:
-                story_points = None
-                
-            # Epic link (for non-epics) with more variability
-            epic_link = None
-            if issue_type != "Epic" and random.random() > 0.4:
-                epic_link = f"{project_key}-{random.randint(1, 20)}"
-                
-            # Assign based on repo focus and individual characteristics
-            # First select a team based on repo focus
-            team_weights = [team_info["repo_focus"][repo_name] for team_name, team_info in TEAM_CONFIG.items()]
-            team_name = weighted_choice(list(TEAM_CONFIG.keys()), team_weights)
-            
-            # Get team productivity factor from stored value
-            team_prod_factor = team_productivity[team_name]
-            
-            # Then select team members with bias based on issue characteristics
-            team_members = [member for member, team in team_member_map.items() if team == team_name]
-            
-            # Weighted selection of author based on activity level and specialization
-            author_weights = []
-            for member in team_members:
-                char = dev_characteristics[member]
-                weight = char["activity"]  # Base on activity level
-                
-                # Adjust based on specialization for this issue type
-                if issue_type == "Bug":
-                    weight *= char["specializations"]["bug_fixing"]
-                elif issue_type == "Epic":
-                    weight *= char["specializations"]["features"]
-                
-                # Consider complexity preference
-                weight *= (1 + (complexity_factor - 1) * (char["complexity_preference"] - 1))
-                
-                author_weights.append(weight)
-            
-            # Normalize weights
-            total_weight = sum(author_weights)
-            if total_weight > 0:
-                author_weights = [w/total_weight for w in author_weights]
-                author = random.choices(team_members, weights=author_weights, k=1)[0]
-            else:
-                author = random.choice(team_members)
-            
-            # Assignee is sometimes different, sometimes the same, sometimes null
-            if random.random() > 0.2:  # 80% of issues have assignees
-                if random.random() > 0.3:  # 70% of assigned issues go to a different person
-                    assignees = [m for m in team_members if m != author]
-                    if assignees:
-                        assignee = random.choice(assignees)
-                    else:
-                        assignee = author
-                else:
-                    assignee = author
-            else:
-                assignee = None
-            
-            # Number of comments varies by complexity and issue type
-            base_comments = int(np.random.normal(5, 4))  # Mean of 5 comments
-            comment_factor = 1.0
-            
-            # More complex issues tend to have more comments
-            comment_factor *= complexity_factor
-            
-            # Different issue types have different comment patterns
-            if issue_type == "Bug":
-                comment_factor *= 1.2  # Bugs often have more back-and-forth
-            elif issue_type == "Epic":
-                comment_factor *= 1.5  # Epics often have more discussion
-                
-            comment_count = max(0, int(base_comments * comment_factor))
-            
-            # Create issue with Jira fields
-            issue_id = i + 1 + (repo_idx * ISSUES_PER_REPO)
-            issue_key = f"{project_key}-{issue_id}"
-            
-            # Store issue key for later reference
-            issue_id_to_key[issue_id] = issue_key
-            
-            # Create more varied issue titles
-            title_prefixes = ["Add", "Fix", "Update", "Implement", "Refactor", "Optimize", "Remove", "Investigate", "Improve"]
-            title_components = ["functionality", "feature", "component", "module", "integration", "API", "UI element", "workflow", "process"]
-            
-            if issue_type == "Bug":
-                title = f"{issue_type}: {random.choice(['Fix', 'Address', 'Resolve'])} {random.choice(['issue with', 'bug in', 'problem with'])} {random.choice(components) if components else random.choice(title_components)} in {repo_name}"
-            else:
-                title = f"{issue_type}: {random.choice(title_prefixes)} {random.choice(components) if components else random.choice(title_components)} for {repo_name}"
-            
-            issue = Issue(
-                issue_id=issue_id,
-                issue_key=issue_key,
-                project_key=project_key,
-                repo=repo_path,
-                title=title,
-                description=f"This is a mock description for issue #{i} in {repo_name}.\n\nSteps to reproduce:\n1. Step one\n2. Step two\n3. Step three",
-                issue_type=issue_type,
-                author=author,
-                assignee=assignee,
-                created_at=created_date,
-                updated_at=updated_date,
-                closed_at=closed_date,
-                due_date=due_date,
-                status=status,
-                resolution=resolution,
-                priority=priority,
-                comment_count=comment_count,
-                labels=labels,
-                components=components,
-                sprint=sprint,
-                story_points=story_points,
-                epic_link=epic_link
-            )
-            
-            all_issues.append(issue)
-            
-            # Batch insert if we've reached the batch size
-            if len(all_issues) >= BATCH_SIZE:
-                Issue.objects.insert(all_issues)
-                all_issues = []
+    # Each repo's issues are independent, so build them in parallel - one worker per repo,
+    # each with its own random stream
+    repo_args = [
+        (repo_idx, repo_name, get_worker_rng(repo_idx), repo_complexity[repo_name],
+         author_work_patterns, team_soa)
+        for repo_idx, repo_name in enumerate(REPOS)
+    ]
+    # The pool is reused for commits and workflow runs further down. Its worker processes
+    # are forked here, before the bulk writer threads start, and live until it is closed
+    pool = Pool(processes=len(REPOS))
+    issues_by_repo = pool.map(build_issues_for_repo, repo_args)
+    
+    issues_df = pd.concat(issues_by_repo, ignore_index=True)
+    
+    # Mapping from issue ID to issue key for later reference
+    issue_id_to_key = dict(zip(issues_df["issue_id"].tolist(), issues_df["_id"].tolist()))
+    
+    all_issues = dataframe_to_documents(issues_df)
     
-    # Insert any remaining issues
-    if all_issues:
-        Issue.objects.insert(all_issues)
+    # From here on batches are written by background threads. They are only started
+    # now, after the worker pool has forked its processes, so no process is forked
+    # while they run
+    write_queue, writer_threads, writer_results = start_bulk_writers()
+    
+    # Insert issues in batches
+    for batch_start in range(0, len(all_issues), BATCH_SIZE):
+        write_queue.put((Issue, all_issues[batch_start:batch_start + BATCH_SIZE]))
     
     print(f"Generated {ISSUES_PER_REPO * len(REPOS)} issues with variable lead times")
     
@@ -714,63 +1703,92 @@ def generate_mock_data():
     pr_ids_by_repo = {repo_name: [] for repo_name in REPOS}
     pr_authors_by_id = {}
     
+    rng = _RNG
+    
     for repo_idx, repo_name in enumerate(REPOS):
         repo_path = f"{ORG_NAME}/{repo_name}"
         
-        for i in tqdm(range(PRS_PER_REPO), desc=f"PRs for {repo_name}"):
-            # Random dates within range, with more clustering and variability
-            created_date = random_date(SIMULATION_START_DATE, SIMULATION_END_DATE, "variable")
+        # Random dates within range, with more clustering and variability (as epoch
+        # seconds, so review/close dates below are plain integer arithmetic)
+        created_secs = random_epoch_seconds_batch(
+            SIMULATION_START_DATE, SIMULATION_END_DATE, PRS_PER_REPO, "variable", rng=rng
+        )
+        
+        # PR size varies more widely - long-tail distribution for file changes
+        changed_files_arr = long_tail_distribution(1, 50, shape=1.5, size=PRS_PER_REPO, rng=rng).astype(int)
+        
+        # Lines changed increases with file count but with variability
+        base_lines_arr = changed_files_arr * rng.integers(5, 51, PRS_PER_REPO)
+        additions_arr = (base_lines_arr * rng.uniform(0.5, 1.5, PRS_PER_REPO)).astype(int).tolist()
+        deletions_arr = (base_lines_arr * rng.uniform(0.2, 1.0, PRS_PER_REPO)).astype(int).tolist()
+        
+        # PR title parts
+        pr_verb_arr = rng.choice(common_verbs, size=PRS_PER_REPO).tolist()
+        pr_target_arr = rng.choice(common_targets, size=PRS_PER_REPO).tolist()
+        
+        # PR complexity affects review time (clamped to a wide range)
+        complexity_factor_arr = np.clip(rng.normal(1.0, 0.6, PRS_PER_REPO), 0.3, 3.5)
+        
+        # Review time with high variability: 8% of PRs are outliers taking 3-10 days,
+        # the rest take a 1-48 hour base scaled by complexity
+        review_time_hours_arr = np.where(
+            rng.random(PRS_PER_REPO) < 0.08,
+            rng.integers(72, 241, PRS_PER_REPO),
+            (rng.integers(1, 49, PRS_PER_REPO) * complexity_factor_arr).astype(int)
+        )
+        
+        # Some PRs are still open - more complex PRs less likely to be closed
+        is_closed_arr = rng.random(PRS_PER_REPO) > (0.2 + 0.05 * complexity_factor_arr)
+        
+        # Not all closed PRs are merged - more complex PRs more likely to be rejected
+        is_merged_arr = is_closed_arr & (rng.random(PRS_PER_REPO) > (0.1 + 0.1 * complexity_factor_arr))
+        
+        # Some closed PRs (5%) are reopened and closed again
+        reopen_hours_arr = np.where(rng.random(PRS_PER_REPO) < 0.05, rng.integers(24, 73, PRS_PER_REPO), 0)
+        
+        # Number of comments varies by PR complexity and size: a base of 3 comments on
+        # average, more for complex PRs and half again as many for large PRs
+        comment_count_arr = np.maximum(0, (
+            rng.normal(3, 3, PRS_PER_REPO).astype(int)
+            * (complexity_factor_arr * np.where(changed_files_arr > 10, 1.5, 1.0))
+        ).astype(int)).tolist()
+        
+        # Convert the dates in one shot each
+        created_dates = epoch_seconds_to_datetimes(created_secs)
+        closed_dates = epoch_seconds_to_datetimes(
+            created_secs + (review_time_hours_arr + reopen_hours_arr) * 3600, is_closed_arr
+        )
+        complexity_factor_arr = complexity_factor_arr.tolist()
+        is_closed_arr = is_closed_arr.tolist()
+        is_merged_arr = is_merged_arr.tolist()
+        changed_files_arr = changed_files_arr.tolist()
+        
+        # Team behind each PR, based on repo focus
+        team_name_arr = team_choices_for_repo(repo_name, PRS_PER_REPO, rng)
+        
+        for i in progress_range(PRS_PER_REPO, f"PRs for {repo_name}"):
+            created_date = created_dates[i]
             
             # PR complexity affects review time
-            complexity_factor = np.random.normal(1.0, 0.6)  
-            complexity_factor = max(0.3, min(complexity_factor, 3.5))  # Allow wider range
-            
-            # Some PRs have very long review times (outliers)
-            review_time_outlier = random.random() < 0.08  # 8% of PRs
-            
-            # Calculate review time with high variability
-            if review_time_outlier:
-                # Outlier review time - much longer
-                review_time_hours = random.randint(72, 240)  # 3-10 days
-            else:
-                # Normal review time with variability based on complexity
-                base_review_time = random.randint(1, 48)  # 1-48 hours base
-                review_time_hours = int(base_review_time * complexity_factor)
-            
-            # Some PRs are still open with more variable distribution
-            is_closed = random.random() > (0.2 + 0.05 * complexity_factor)  # More complex PRs less likely to be closed
+            complexity_factor = complexity_factor_arr[i]
             
-            # Not all closed PRs are merged - some are abandoned/rejected
-            is_merged = is_closed and random.random() > (0.1 + 0.1 * complexity_factor)  # More complex PRs more likely to be rejected
-            
-            # Calculate closed date with variable review time
-            if is_closed:
-                closed_date = created_date + timedelta(hours=review_time_hours)
-                
-                # Some PRs are reopened and closed again
-                if random.random() < 0.05:  # 5% of closed PRs
-                    closed_date += timedelta(hours=random.randint(24, 72))
-            else:
-                closed_date = None
-                
-            merged_date = closed_date if is_merged else None
+            # Closed date with variable review time (None while open); merged PRs merge on close
+            is_closed = is_closed_arr[i]
+            closed_date = closed_dates[i]
+            merged_date = closed_date if is_merged_arr[i] else None
             
             # PR review count with more variability based on complexity
             if complexity_factor < 1.0:
-                review_count = random.randint(0, 2)
+                review_count = _randint(0, 2)
             elif complexity_factor < 2.0:
-                review_count = random.randint(1, 4)
+                review_count = _randint(1, 4)
             else:
-                review_count = random.randint(2, 7)  # More complex PRs get more reviews
+                review_count = _randint(2, 7)  # More complex PRs get more reviews
             
-            # PR size varies more widely
-            # Use long-tail distribution for file changes and lines
-            changed_files = int(long_tail_distribution(1, 50, shape=1.5))
-            
-            # Lines changed increases with file count but with variability
-            base_lines = changed_files * random.randint(5, 50)
-            additions = int(base_lines * random.uniform(0.5, 1.5))
-            deletions = int(base_lines * random.uniform(0.2, 1.0))
+            # PR size varies more widely (long-tail file changes and lines, drawn per repo)
+            changed_files = changed_files_arr[i]
+            additions = additions_arr[i]
+            deletions = deletions_arr[i]
             
             # Link to issues - more variable linking patterns
             linked_issue_key = None
@@ -780,70 +1798,38 @@ def generate_mock_data():
             if changed_files > 10:
                 link_probability += 0.2
                 
-            if random.random() < link_probability:
-                project_key = PROJECT_KEYS[repo_name]
+            if _random() < link_probability:
                 # Get a random issue ID within the range for this repo
-                issue_idx = random.randint(0, ISSUES_PER_REPO - 1)
+                issue_idx = _randint(0, ISSUES_PER_REPO - 1)
                 issue_id = issue_idx + 1 + (repo_idx * ISSUES_PER_REPO)
                 linked_issue_key = issue_id_to_key.get(issue_id)
             
             # Assign based on repo focus and individual characteristics
             # First select a team based on repo focus
-            team_weights = [team_info["repo_focus"][repo_name] for team_name, team_info in TEAM_CONFIG.items()]
-            team_name = weighted_choice(list(TEAM_CONFIG.keys()), team_weights)
+            team_name = team_name_arr[i]
             
             # Get team productivity factor from stored value
             team_prod_factor = team_productivity[team_name]
             
             # Then select team members with bias based on PR characteristics
-            team_members = [member for member, team in team_member_map.items() if team == team_name]
+            soa = team_soa[team_name]
             
             # Weighted selection of author based on activity level and PR size preference
-            author_weights = []
-            for member in team_members:
-                char = dev_characteristics[member]
-                weight = char["activity"]  # Base on activity level
-                
-                # Adjust based on preference for PR size
-                size_factor = (changed_files / 10.0) - 1.0  # -0.9 for small PRs, >0 for large PRs
-                weight *= (1 + size_factor * (char["task_size_preference"] - 1))
-                
-                author_weights.append(max(0.1, weight))  # Ensure positive weight
-            
-            # Normalize weights
-            total_weight = sum(author_weights)
-            if total_weight > 0:
-                author_weights = [w/total_weight for w in author_weights]
-                author = random.choices(team_members, weights=author_weights, k=1)[0]
-            else:
-                author = random.choice(team_members)
-            
-            # Number of comments varies by PR complexity and size
-            base_comments = int(np.random.normal(3, 3))  # Mean of 3 comments
-            comment_factor = 1.0
+            size_factor = (changed_files / 10.0) - 1.0  # -0.9 for small PRs, >0 for large PRs
+            author_weights = soa["activity"] * (1 + size_factor * (soa["task_size_pref"] - 1))
+            author_weights = np.maximum(0.1, author_weights)  # Ensure positive weight
             
-            # More complex PRs tend to have more comments
-            comment_factor *= complexity_factor
+            # Pick by bisecting a uniform draw into the cumulative weights (no need to normalize)
+            cum_weights = np.cumsum(author_weights)
+            author = str(soa["members"][np.searchsorted(cum_weights, rng.random() * cum_weights[-1], side="right")])
             
-            # Larger PRs tend to have more comments
-            if changed_files > 10:
-                comment_factor *= 1.5
-            
-            comment_count = max(0, int(base_comments * comment_factor))
+            comment_count = comment_count_arr[i]
             
-            # PR title and body
             # PR title with proper issue reference format [PROJECT-123]
             if linked_issue_key:
-                title = f"[{linked_issue_key}] {random.choice(common_verbs)} {random.choice(common_targets)} in {repo_name}"
+                title = f"[{linked_issue_key}] {pr_verb_arr[i]} {pr_target_arr[i]} in {repo_name}"
             else:
-                title = f"{random.choice(common_verbs)} {random.choice(common_targets)} in {repo_name}"
-            
-            # Generate a PR body that references the issue (not stored in DB but used for message)
-            body = f"""
-            This PR implements changes for {linked_issue_key if linked_issue_key else "feature development"}.
-            
-            {f"Fixes [{linked_issue_key}]" if linked_issue_key else ""}
-            """
+                title = f"{pr_verb_arr[i]} {pr_target_arr[i]} in {repo_name}"
             
             pr_id = i + 1 + (repo_idx * PRS_PER_REPO)
             
@@ -851,33 +1837,37 @@ def generate_mock_data():
             pr_ids_by_repo[repo_name].append(pr_id)
             pr_authors_by_id[pr_id] = author
             
-            pr = PullRequest(
-                pr_id=pr_id,
-                repo=repo_path,
-                title=title,
-                author=author,
-                created_at=created_date,
-                closed_at=closed_date,
-                merged_at=merged_date,
-                state="closed" if is_closed else "open",
-                review_count=review_count,
-                comment_count=comment_count,
-                additions=additions,
-                deletions=deletions,
-                changed_files=changed_files
-                # Note: linked_issue and body don't exist in the model
-            )
+            # Raw PullRequest document (linked_issue and body don't exist in the model)
+            pr = {
+                "_id": pr_id,
+                "repo": repo_path,
+                "title": title,
+                "author": author,
+                "created_at": created_date,
+                "state": "closed" if is_closed else "open",
+                "review_count": review_count,
+                "comment_count": comment_count,
+                "additions": additions,
+                "deletions": deletions,
+                "changed_files": changed_files
+            }
+            
+            # Dates of open/unmerged PRs are left out, like Document.to_mongo() does
+            if closed_date is not None:
+                pr["closed_at"] = closed_date
+            if merged_date is not None:
+                pr["merged_at"] = merged_date
             
             all_prs.append(pr)
             
             # Batch insert if we've reached the batch size
             if len(all_prs) >= BATCH_SIZE:
-                PullRequest.objects.insert(all_prs)
+                write_queue.put((PullRequest, all_prs))
                 all_prs = []
     
     # Insert any remaining PRs
     if all_prs:
-        PullRequest.objects.insert(all_prs)
+        write_queue.put((PullRequest, all_prs))
     
     print(f"Generated {PRS_PER_REPO * len(REPOS)} PRs with variable review patterns")
     
@@ -885,440 +1875,55 @@ def generate_mock_data():
     # Generate commits with references to PRs and variable frequencies
     # -------------------------------------------------------------------------
     print(f"Generating commits ({COMMITS_PER_REPO} per repo) with variable frequencies...")
-    all_commits = []
+    print(f"Generating workflow runs ({WORKFLOW_RUNS_PER_REPO} per repo) with long-tail execution times...")
     
-    # Different commit frequency patterns by developer
-    # Note: This was simplified as we're using cluster-based commit patterns below
-    # which accomplishes the same goal more effectively
+    # Commits and workflow runs are independent per repo, so hand both to the worker
+    # pool at once, each repo with its own random streams. Commits use cluster-based
+    # dates, which covers the different commit frequency patterns by developer
+    commit_args = [
+        (repo_idx, repo_name, get_worker_rng(len(REPOS) + repo_idx), pr_ids_by_repo[repo_name],
+         {pr_id: pr_authors_by_id[pr_id] for pr_id in pr_ids_by_repo[repo_name]},
+         linked_issue_key, members_by_team, team_soa)
+        for repo_idx, repo_name in enumerate(REPOS)
+    ]
     
-    for repo_idx, repo_name in enumerate(REPOS):
-        repo_path = f"{ORG_NAME}/{repo_name}"
-        pr_ids = pr_ids_by_repo[repo_name]
-        
-        # Create clusters of commit dates to simulate real development patterns
-        num_clusters = random.randint(30, 100)  # Number of development "bursts"
-        cluster_centers = []
-        
-        for _ in range(num_clusters):
-            # Create a random center within the date range
-            center_date = random_date(SIMULATION_START_DATE, SIMULATION_END_DATE, "uniform")
-            # Random cluster size (how many commits in this burst)
-            cluster_size = int(np.random.normal(COMMITS_PER_REPO / num_clusters, COMMITS_PER_REPO / (num_clusters * 3)))
-            cluster_size = max(1, cluster_size)
-            # Random cluster spread (how spread out in time)
-            cluster_spread_hours = random.randint(1, 72)
-            
-            cluster_centers.append((center_date, cluster_size, cluster_spread_hours))
-        
-        # Track commits assigned to each PR for realistic batching
-        commits_per_pr = {}
-        
-        for i in tqdm(range(COMMITS_PER_REPO), desc=f"Commits for {repo_name}"):
-            # Choose a random cluster based on its size
-            weights = [size for _, size, _ in cluster_centers]
-            total_weight = sum(weights)
-            if total_weight == 0:
-                # Fallback if all clusters are depleted
-                committed_date = random_date(SIMULATION_START_DATE, SIMULATION_END_DATE, "uniform", weekday_bias=True)
-            else:
-                # Normalize weights
-                weights = [w/total_weight for w in weights]
-                chosen_idx = random.choices(range(len(cluster_centers)), weights=weights)[0]
-                center_date, size, spread_hours = cluster_centers[chosen_idx]
-                
-                # Reduce the size of the chosen cluster
-                cluster_centers[chosen_idx] = (center_date, size-1, spread_hours)
-                
-                # Generate date within the cluster
-                time_offset = np.random.normal(0, spread_hours * 0.3)
-                time_offset = max(-spread_hours, min(time_offset, spread_hours))
-                committed_date = center_date + timedelta(hours=time_offset)
-                
-                # Ensure date is within simulation range and apply weekday bias
-                committed_date = max(SIMULATION_START_DATE, min(committed_date, SIMULATION_END_DATE))
-                
-                # Apply weekday bias directly (70% chance to move weekend commits to weekdays)
-                if committed_date.weekday() >= 5 and random.random() < 0.7:
-                    # Move to previous Friday or next Monday
-                    if random.random() < 0.5:
-                        # Go forward to Monday
-                        days_to_add = 7 - committed_date.weekday()
-                        committed_date += timedelta(days=days_to_add)
-                    else:
-                        # Go backward to Friday
-                        days_to_subtract = committed_date.weekday() - 4
-                        committed_date -= timedelta(days=days_to_subtract)
-            
-            # Add realistic hour of day based on developer patterns
-            dev_char = dev_characteristics.get(author, {})
-            work_pattern = "business"
-            if "work_pattern" in dev_char:
-                if dev_char["work_pattern"] == 0:
-                    work_pattern = "distributed"
-                elif dev_char["work_pattern"] == 2:
-                    work_pattern = "night_owl"
-                    
-            hour = random_hour_of_day(work_pattern)
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            committed_date = committed_date.replace(hour=hour, minute=minute, second=second)
-            
-            # Link to PR with variable patterns
-            # Some commits are not linked to any PR
-            if pr_ids and random.random() < 0.8:
-                if random.random() < 0.7:  # 70% chance to select by PR commit count for realistic batching
-                    pr_weights = []
-                    for pr_id in pr_ids:
-                        # Prefer PRs with some commits but not too many
-                        count = commits_per_pr.get(pr_id, 0)
-                        if count == 0:
-                            weight = 3.0  # High chance for PRs with no commits
-                        elif count < 5:
-                            weight = 5.0  # Higher chance for PRs with few commits
-                        elif count < 10:
-                            weight = 2.0  # Medium chance
-                        else:
-                            weight = 0.5  # Low chance for PRs with many commits
-                        pr_weights.append(weight)
-                    
-                    # Normalize weights
-                    total_weight = sum(pr_weights)
-                    pr_weights = [w/total_weight for w in pr_weights]
-                    linked_pr_id = random.choices(pr_ids, weights=pr_weights)[0]
-                else:
-                    linked_pr_id = random.choice(pr_ids)
-                
-                # Increment commit count for this PR
-                commits_per_pr[linked_pr_id] = commits_per_pr.get(linked_pr_id, 0) + 1
-            else:
-                linked_pr_id = None
-            
-            # Assign author based on repo focus and individual characteristics
-            # First select a team based on repo focus
-            team_weights = [team_info["repo_focus"][repo_name] for team_name, team_info in TEAM_CONFIG.items()]
-            team_name = weighted_choice(list(TEAM_CONFIG.keys()), team_weights)
-            
-            # Then select team members with bias based on commit patterns
-            team_members = [member for member, team in team_member_map.items() if team == team_name]
-            
-            # Weighted selection of author based on activity level and commit patterns
-            author_weights = []
-            for member in team_members:
-                char = dev_characteristics[member]
-                
-                # Base on activity level
-                weight = char["activity"] * 0.5 + 0.5  # Soften the impact of activity level
-                
-                # For linked PRs, prefer the PR author
-                if linked_pr_id:
-                    pr_author = pr_authors_by_id.get(linked_pr_id)
-                    if pr_author and pr_author == member:
-                        # This member is the PR author, give higher weight
-                        weight *= 3.0
-                
-                author_weights.append(max(0.1, weight))  # Ensure positive weight
-            
-            # Normalize weights
-            total_weight = sum(author_weights)
-            if total_weight > 0:
-                author_weights = [w/total_weight for w in author_weights]
-                author = random.choices(team_members, weights=author_weights, k=1)[0]
-            else:
-                author = random.choice(team_members)
-            
-            # Generate commit size with more variability
-            # Different developers have different commit size patterns
-            dev_char = dev_characteristics[author]
-            size_preference = dev_char["task_size_preference"]
-            
-            # Use long-tail distribution for additions/deletions
-            # Smaller or larger based on developer preference
-            additions = int(long_tail_distribution(3, 300, shape=1.2) * size_preference)
-            deletions = int(long_tail_distribution(0, 100, shape=1.5) * size_preference)
-            files_changed = max(1, int(np.random.normal(3, 2) * size_preference))
-            
-            # Commit message with proper issue/PR reference format [PROJECT-123]
-            # First define the message content
-            message_content = random.choice(message_styles)
-            
-            # Then add the appropriate prefix
-            if linked_issue_key:
-                # Include issue key reference
-                message = f"[{linked_issue_key}] {message_content}"
-            elif linked_pr_id:
-                # Just PR reference if no issue
-                message = f"[PR-{linked_pr_id}] {message_content}"
-            else:
-                # No references
-                message = message_content
-            
-            commit = Commit(
-                sha=f"{repo_path}-commit-{i}-{int(time.time())}",
-                repo=repo_path,
-                author=author,
-                committed_at=committed_date,
-                message=message,
-                additions=additions,
-                deletions=deletions,
-                files_changed=files_changed
-                # Note: linked_pr doesn't exist in the model
-            )
-            
-            all_commits.append(commit)
-            
-            # Batch insert if we've reached the batch size
-            if len(all_commits) >= BATCH_SIZE:
-                Commit.objects.insert(all_commits)
-                all_commits = []
+    # Unique 10-digit run IDs for every run in every repo, drawn in one go
+    run_ids = rng.choice(10 ** 10, size=WORKFLOW_RUNS_PER_REPO * len(REPOS), replace=False).tolist()
+    workflow_args = [
+        (repo_idx, repo_name, get_worker_rng(2 * len(REPOS) + repo_idx), pr_ids_by_repo[repo_name],
+         run_ids[repo_idx * WORKFLOW_RUNS_PER_REPO:(repo_idx + 1) * WORKFLOW_RUNS_PER_REPO])
+        for repo_idx, repo_name in enumerate(REPOS)
+    ]
+    
+    commits_by_repo = pool.imap(build_commits_for_repo, commit_args)
+    workflows_by_repo = pool.imap(build_workflow_runs_for_repo, workflow_args)
     
-    # Insert any remaining commits
-    if all_commits:
-        Commit.objects.insert(all_commits)
+    # Queue each repo's documents in BATCH_SIZE slices as soon as its worker is done
+    for commits in commits_by_repo:
+        for batch_start in range(0, len(commits), BATCH_SIZE):
+            write_queue.put((Commit, commits[batch_start:batch_start + BATCH_SIZE]))
     
     print(f"Generated {COMMITS_PER_REPO * len(REPOS)} commits with variable patterns")
     
-    # -------------------------------------------------------------------------
-    # Generate workflow runs with long-tail distribution for run times
-    # -------------------------------------------------------------------------
-    print(f"Generating workflow runs ({WORKFLOW_RUNS_PER_REPO} per repo) with long-tail execution times...")
-    all_workflows = []
+    for workflows in workflows_by_repo:
+        for batch_start in range(0, len(workflows), BATCH_SIZE):
+            write_queue.put((WorkflowRun, workflows[batch_start:batch_start + BATCH_SIZE]))
     
-    for repo_idx, repo_name in enumerate(REPOS):
-        repo_path = f"{ORG_NAME}/{repo_name}"
-        pr_ids = pr_ids_by_repo[repo_name]
-        
-        # Create success rate trends over time to simulate improvement or degradation
-        success_rate_trend = random.choice([
-            "improving",      # Success rate increases over time
-            "degrading",      # Success rate decreases over time
-            "stable",         # Success rate stays relatively stable
-            "fluctuating",    # Success rate goes up and down
-            "step_change"     # Success rate changes dramatically at some point
-        ])
-        
-        # For step change, decide when it happens
-        step_change_point = random.uniform(0.3, 0.7)  # Between 30% and 70% through the timeline
-        
-        # Base success rates
-        if success_rate_trend == "improving":
-            start_success_rate = 0.6 + random.uniform(0, 0.2)
-            end_success_rate = 0.8 + random.uniform(0, 0.15)
-        elif success_rate_trend == "degrading":
-            start_success_rate = 0.8 + random.uniform(0, 0.15)
-            end_success_rate = 0.6 + random.uniform(0, 0.2)
-        elif success_rate_trend == "stable":
-            mid_rate = 0.75 + random.uniform(-0.1, 0.1)
-            start_success_rate = end_success_rate = mid_rate
-        elif success_rate_trend == "fluctuating":
-            mid_rate = 0.75 + random.uniform(-0.1, 0.1)
-            fluctuation = 0.1 + random.uniform(0, 0.1)
-            start_success_rate = end_success_rate = mid_rate
-            # Fluctuation handled during run generation
-        else:  # step_change
-            if random.random() < 0.5:  # 50% chance of improvement
-                start_success_rate = 0.65 + random.uniform(-0.1, 0.1)
-                end_success_rate = 0.85 + random.uniform(-0.05, 0.1)
-            else:  # 50% chance of degradation
-                start_success_rate = 0.85 + random.uniform(-0.05, 0.1)
-                end_success_rate = 0.65 + random.uniform(-0.1, 0.1)
-        
-        for i in tqdm(range(WORKFLOW_RUNS_PER_REPO), desc=f"Workflow runs for {repo_name}"):
-            # Random date with weekday bias
-            created_date = random_date(SIMULATION_START_DATE, SIMULATION_END_DATE, "variable", weekday_bias=True)
-            
-
-            # Execution time varies by workflow type with true long-tail distribution
-            # Different workflow types have different distributions
-            workflow_types = ["light_ci", "medium_test", "heavy_deployment"]
-            workflow_weights = [0.5, 0.3, 0.2]  # More light CI runs than deployments
-            workflow_type = weighted_choice(workflow_types, workflow_weights)
-
-            # Add hour of day based on workflow type (deployments often during non-peak hours)
-            if workflow_type == "heavy_deployment":
-                # Deployments often happen in early morning or evening
-                hour_options = list(range(6, 9)) + list(range(17, 20))
-                hour = random.choice(hour_options)
-            else:
-                # Regular CI typically follows work patterns
-                hour = random_hour_of_day("business")
-                
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            created_date = created_date.replace(hour=hour, minute=minute, second=second)
-            
-            # Calculate where in the timeline this run falls (0 to 1)
-            timeline_position = (created_date - SIMULATION_START_DATE).total_seconds() / \
-                               (SIMULATION_END_DATE - SIMULATION_START_DATE).total_seconds()
-            
-            # Calculate success rate based on trend
-            if success_rate_trend == "improving" or success_rate_trend == "degrading":
-                current_success_rate = start_success_rate + (end_success_rate - start_success_rate) * timeline_position
-            elif success_rate_trend == "fluctuating":
-                # Create a sine wave pattern with random phase
-                phase = random.uniform(0, 6.28)  # 0 to 2π
-                cycles = 3 + random.uniform(0, 2)  # Number of cycles over the time period
-                current_success_rate = start_success_rate + \
-                                      0.15 * np.sin(phase + cycles * 6.28 * timeline_position)
-            elif success_rate_trend == "step_change":
-                if timeline_position < step_change_point:
-                    current_success_rate = start_success_rate
-                else:
-                    # Linear blend right at the step change point for a bit of smoothing
-                    if timeline_position < step_change_point + 0.05:
-                        blend_factor = (timeline_position - step_change_point) / 0.05
-                        current_success_rate = start_success_rate * (1 - blend_factor) + end_success_rate * blend_factor
-                    else:
-                        current_success_rate = end_success_rate
-            else:  # stable
-                # Add small random variations to stable
-                current_success_rate = start_success_rate + random.uniform(-0.05, 0.05)
-            
-            # Clamp to reasonable range
-            current_success_rate = max(0.5, min(current_success_rate, 0.98))
-            
-            # Simulate both fast and slow runner pickups with long tail distribution
-            pickup_delay = long_tail_distribution(0.1, 1800, shape=1.2)  # 0.1sec to 30min
-            
-            started_date = created_date + timedelta(seconds=pickup_delay)
-            
-            
-            
-            if workflow_type == "light_ci":
-                # Lighter CI jobs - mostly quick with occasional slowness
-                execution_time = long_tail_distribution(15, 1800, shape=1.5)  # 15sec to 30min
-            elif workflow_type == "medium_test":
-                # Medium tests - wider range
-                execution_time = long_tail_distribution(180, 3600, shape=1.3)  # 3min to 60min
-            else:  # heavy_deployment
-                # Heavy deployment jobs - long with high variability
-                execution_time = long_tail_distribution(300, 7200, shape=1.1)  # 5min to 2hrs
-            
-            completed_date = started_date + timedelta(seconds=execution_time)
-            
-            # Different workflow conclusions with variable success rates
-            conclusions = ["success", "failure", "cancelled", "timed_out"]
-            
-            # Base weights on current success rate
-            success_weight = current_success_rate
-            failure_weight = (1 - current_success_rate) * 0.7  # 70% of non-success is failure
-            cancelled_weight = (1 - current_success_rate) * 0.2  # 20% is cancelled
-            timeout_weight = (1 - current_success_rate) * 0.1  # 10% is timeout
-            
-            weights = [success_weight, failure_weight, cancelled_weight, timeout_weight]
-            conclusion = weighted_choice(conclusions, weights)
-            
-            # More complex runs more likely to fail
-            if execution_time > 1800 and conclusion == "success":  # For runs over 30 minutes
-                if random.random() < 0.3:  # 30% chance to override to failure
-                    conclusion = "failure"
-            
-            # Different runner types with different reliability
-            runner_type = random.choice(["GitHub-hosted", "self-hosted"])
-            if runner_type == "GitHub-hosted":
-                runner_name = random.choice(["ubuntu-latest", "windows-latest", "macos-latest"])
-                
-                # Different OS runners have different reliability patterns
-                if runner_name == "windows-latest" and conclusion == "success":
-                    if random.random() < 0.15:  # Windows slightly less reliable
-                        conclusion = random.choice(["failure", "timed_out"])
-            else:
-                runner_name = random.choice(["custom-runner-1", "custom-runner-2", "custom-large-runner"])
-                
-                # Custom runners might have specific issues
-                if runner_name == "custom-runner-1" and conclusion == "success":
-                    if random.random() < 0.1:  # Slight reliability issues
-                        conclusion = "failure"
-            
-            # Link to PR - more variable by workflow and repo type
-            linked_pr_id = None
-            link_probability = 0.7  # Base probability
-            
-            # Frontend repo may have more workflow runs not linked to PRs
-            if repo_name == "frontend":
-                link_probability -= 0.1
-            
-            # Deployment workflows less likely to be directly linked to PRs
-            if workflow_type == "heavy_deployment":
-                link_probability -= 0.2
-            
-            if pr_ids and random.random() < link_probability:
-                linked_pr_id = random.choice(pr_ids)
-            
-            # Branch distribution - more realistic patterns
-            if linked_pr_id and random.random() < 0.8:
-                # If linked to PR, use a feature branch name with different patterns
-                branch_patterns = [
-                    f"feature/PR-{linked_pr_id}",
-                    f"feature/{random.choice(['add', 'fix', 'update'])}-{random.choice(['auth', 'ui', 'api', 'docs'])}-{linked_pr_id}",
-                    f"bugfix/issue-{random.randint(100, 999)}",
-                    f"user/{random.choice(['dev', 'jsmith', 'apatterson'])}/{random.choice(['feature', 'fix', 'refactor'])}-{random.randint(1, 99)}"
-                ]
-                branch = random.choice(branch_patterns)
-            else:
-                # More realistic distribution of branches
-                branch_options = ["main"] * 15 + ["master"] * 5 + ["develop"] * 8 + ["staging"] * 5 + ["release"] * 3
-                for i in range(5):
-                    branch_options.append(f"feature-{i}")
-                branch = random.choice(branch_options)
-            
-            # Workflow name based on type and repo with more variation
-            workflow_categories = {
-                "CI": ["Build", "Test", "Lint", "Validate", "Verify"],
-                "Deploy": ["Deploy to Dev", "Deploy to Staging", "Deploy to Production", "Release"],
-                "Test": ["Unit Tests", "Integration Tests", "E2E Tests", "Acceptance Tests", "Performance Tests"],
-                "Checks": ["Security Scan", "Dependency Check", "Code Quality", "Coverage"]
-            }
-            
-            if workflow_type == "light_ci":
-                category_weights = [0.6, 0.1, 0.2, 0.1]  # More CI for light workflows
-            elif workflow_type == "medium_test":
-                category_weights = [0.3, 0.1, 0.5, 0.1]  # More Tests for medium workflows
-            else:  # heavy_deployment
-                category_weights = [0.2, 0.6, 0.1, 0.1]  # More Deploy for heavy workflows
-            
-            workflow_category = weighted_choice(list(workflow_categories.keys()), category_weights)
-            workflow_subtype = random.choice(workflow_categories[workflow_category])
-            
-            # Sometimes workflows have team names in them
-            if random.random() < 0.3:
-                team_prefix = f"{random.choice(list(TEAM_CONFIG.keys()))}: "
-            else:
-                team_prefix = ""
-            
-            workflow_name = f"{team_prefix}{repo_name.capitalize()} {workflow_category}: {workflow_subtype}"
-            
-            # Use unique ID generation to avoid duplicates
-            # MongoDB will auto-generate _id if not provided
-            workflow = WorkflowRun(
-                # Use timestamp in ID to guarantee uniqueness
-                run_id=int(uuid.uuid4().int % (10 ** 10)),
-                repo=repo_path,
-                workflow_name=workflow_name,
-                created_at=created_date,
-                started_at=started_date,
-                completed_at=completed_date,
-                conclusion=conclusion,
-                runner_name=runner_name,
-                runner_type=runner_type,
-                pickup_time_seconds=pickup_delay,
-                execution_time_seconds=execution_time,
-                branch=branch
-                # Note: linked_pr doesn't exist in the model so we're not storing it
-            )
-            
-            all_workflows.append(workflow)
-            
-            # Batch insert if we've reached the batch size
-            if len(all_workflows) >= BATCH_SIZE:
-                WorkflowRun.objects.insert(all_workflows)
-                all_workflows = []
-    
-    # Insert any remaining workflow runs
-    if all_workflows:
-        WorkflowRun.objects.insert(all_workflows)
+    pool.close()
+    pool.join()
     
     print(f"Generated {WORKFLOW_RUNS_PER_REPO * len(REPOS)} workflow runs with long-tail execution times")
     
+    # Let the writer threads finish the queued batches; every write is acknowledged,
+    # so all documents are on the server before the indexes are rebuilt
+    inserted_counts = stop_bulk_writers(write_queue, writer_threads, writer_results)
+    
+    # Rebuild the indexes dropped before the bulk load, in one pass per collection
+    print("Rebuilding indexes...")
+    for model_cls in bulk_loaded_models:
+        model_cls.ensure_indexes()
+        model_cls._meta["auto_create_index"] = auto_create_index_flags[model_cls]
+    
     # Report generation time
     end_time = time.time()
     elapsed = end_time - start_time
@@ -1328,12 +1933,12 @@ def generate_mock_data():
     # Summary of generated data
     print("\nGENERATED DATA SUMMARY")
     print("=====================")
-    print(f"Teams: {len(teams)}")
-    print(f"Repositories: {len(repositories)}")
-    print(f"Issues: {ISSUES_PER_REPO * len(REPOS)}")
-    print(f"Pull Requests: {PRS_PER_REPO * len(REPOS)}")
-    print(f"Commits: {COMMITS_PER_REPO * len(REPOS)}")
-    print(f"Workflow Runs: {WORKFLOW_RUNS_PER_REPO * len(REPOS)}")
+    print(f"Teams: {inserted_teams}")
+    print(f"Repositories: {inserted_repositories}")
+    print(f"Issues: {inserted_counts.get('Issue', 0)}")
+    print(f"Pull Requests: {inserted_counts.get('PullRequest', 0)}")
+    print(f"Commits: {inserted_counts.get('Commit', 0)}")
+    print(f"Workflow Runs: {inserted_counts.get('WorkflowRun', 0)}")
 
 if __name__ == "__main__":
     # Connect to MongoDB
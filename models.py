@@ -50,12 +50,13 @@ class PullRequest(me.Document):
     deletions = me.IntField(default=0)
     changed_files = me.IntField(default=0)
     
+    # Compound indexes matching the dashboard filters (optional repo plus a date range),
+    # kept few since every index is updated on each insert during bulk loads
     meta = {
         'indexes': [
-            'repo',
-            'author',
+            ('repo', 'created_at'),
             'created_at',
-            'merged_at'
+            ('author', 'merged_at')
         ]
     }
 
@@ -83,18 +84,16 @@ class Issue(me.Document):
     story_points = me.FloatField()
     epic_link = me.StringField()  # Reference to parent epic
     
+    # issue_key is the _id, so it needs no index of its own; project_key lookups
+    # (e.g. the sidebar's distinct) use the prefix of the compound index
     meta = {
         'indexes': [
-            'repo',
-            'project_key',
-            'author',
-            'assignee',
+            ('repo', 'created_at'),
+            ('project_key', 'created_at'),
+            ('project_key', 'status'),
+            ('assignee', 'status'),
             'created_at',
-            'closed_at',
-            'status',
-            'issue_type',
-            'priority',
-            'sprint'
+            'closed_at'
         ]
     }
 
@@ -110,8 +109,8 @@ class Commit(me.Document):
     
     meta = {
         'indexes': [
-            'repo',
-            'author',
+            ('repo', 'committed_at'),
+            ('author', 'committed_at'),
             'committed_at'
         ]
     }
@@ -132,9 +131,8 @@ class WorkflowRun(me.Document):
     
     meta = {
         'indexes': [
-            'repo',
-            'created_at',
-            'runner_type',
-            'branch'
+            ('repo', 'created_at'),
+            ('branch', 'created_at'),
+            'created_at'
         ]
     }
\ No newline at end of file
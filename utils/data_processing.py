@@ -1,114 +1,255 @@
+from itertools import islice
 import pandas as pd
 import numpy as np
-from scipy import stats
 import plotly.express as px
 import plotly.graph_objects as go
-from bson.json_util import dumps
-import json
+import streamlit as st
+from mongoengine.base import get_document
+
+# pymongoarrow is optional: when installed, flat high-volume collections are read
+# straight from BSON into Arrow columns instead of going through Python dicts
+try:
+    import pyarrow as pa
+    from pymongoarrow.api import Schema, find_pandas_all
+except ImportError:
+    find_pandas_all = None
+
+# Document fields stored as MongoDB dates across all collections
+DATE_FIELDS = ['created_at', 'closed_at', 'merged_at', 'committed_at',
+               'started_at', 'completed_at', 'updated_at', 'due_date']
+
+# Metrics where an increasing trend is good news (coloured green); for everything
+# else, e.g. pickup or lead times, a decreasing trend is the improvement
+_POSITIVE_TREND_COLS = frozenset({
+    'merged_count', 'merge_count', 'commit_count', 'pr_count', 'resolved_count', 'deploy_count'
+})
+
+# Documents pulled from a cursor (and built into a DataFrame) per round trip
+FETCH_BATCH_SIZE = 10000
+
+# Arrow column types per model for the pymongoarrow path; models with list fields
+# (Team, Issue) are left out and always use the cursor path
+ARROW_SCHEMAS = {} if find_pandas_all is None else {
+    'PullRequest': {
+        '_id': pa.int64(), 'repo': pa.string(), 'title': pa.string(), 'author': pa.string(),
+        'created_at': pa.timestamp('ms'), 'closed_at': pa.timestamp('ms'),
+        'merged_at': pa.timestamp('ms'), 'state': pa.string(),
+        'review_count': pa.int64(), 'comment_count': pa.int64(),
+        'additions': pa.int64(), 'deletions': pa.int64(), 'changed_files': pa.int64(),
+    },
+    'Commit': {
+        '_id': pa.string(), 'repo': pa.string(), 'author': pa.string(),
+        'committed_at': pa.timestamp('ms'), 'message': pa.string(),
+        'additions': pa.int64(), 'deletions': pa.int64(), 'files_changed': pa.int64(),
+    },
+    'WorkflowRun': {
+        '_id': pa.int64(), 'repo': pa.string(), 'workflow_name': pa.string(),
+        'created_at': pa.timestamp('ms'), 'started_at': pa.timestamp('ms'),
+        'completed_at': pa.timestamp('ms'), 'conclusion': pa.string(),
+        'runner_name': pa.string(), 'runner_type': pa.string(),
+        'pickup_time_seconds': pa.float64(), 'execution_time_seconds': pa.float64(),
+        'branch': pa.string(),
+    },
+}
 
 def queryset_to_dataframe(queryset):
     """Convert MongoEngine queryset to pandas DataFrame with proper date handling"""
-    if not queryset:
-        return pd.DataFrame()
+    # Iterate the queryset's own raw cursor so its filter, ordering, skip and limit all apply
+    cursor = queryset.as_pymongo().batch_size(FETCH_BATCH_SIZE)
+    return _parse_date_fields(_documents_to_dataframe(cursor))
+
+def fetch_as_dataframe(model, query, fields=None, sort=None, skip=0, limit=0):
+    """
+    Run a raw Mongo query for a model and build a DataFrame from the documents
+    
+    Results are cached by query signature (model, filter, fields, sort, skip and
+    limit), so callers should not add another st.cache_data layer on top.
+    
+    Args:
+        model: MongoEngine document class to query
+        query: Raw Mongo filter document
+        fields: Optional list of field names to load; all fields are loaded when omitted
+        sort: Optional list of (field, direction) pairs
+        skip: Number of documents to skip
+        limit: Maximum number of documents to return, 0 for no limit
         
-    # Convert queryset to JSON
-    json_data = json.loads(dumps(queryset.as_pymongo()))
-    
-    # Convert JSON to DataFrame
-    df = pd.DataFrame(json_data)
-    
-    # Handle MongoDB date fields
-    date_fields = ['created_at', 'closed_at', 'merged_at', 'committed_at', 
-                  'started_at', 'completed_at', 'updated_at', 'due_date']
-    
-    for field in date_fields:
-        if field in df.columns:
-            # Extract datetime strings from potential dictionary objects
-            df[field] = df[field].apply(
-                lambda x: x['$date'] if isinstance(x, dict) and '$date' in x 
-                else (pd.NaT if pd.isna(x) else x)
-            )
-            # Convert to proper datetime objects
-            df[field] = pd.to_datetime(df[field], errors='coerce')
+    Returns:
+        DataFrame with the matching documents
+    """
+    return _fetch_as_dataframe(model.__name__, query, fields, sort, skip, limit)
+
+@st.cache_data(ttl=600)
+def _fetch_as_dataframe(model_name, query, fields, sort, skip, limit):
+    """Cached body of fetch_as_dataframe, keyed on the model name and query arguments"""
+    collection = get_document(model_name)._get_collection()
+    
+    if model_name in ARROW_SCHEMAS:
+        df = _find_arrow_dataframe(collection, model_name, query, fields, sort, skip, limit)
+    else:
+        projection = {field: 1 for field in fields} if fields else None
+        cursor = collection.find(query, projection, sort=sort, skip=skip, limit=limit,
+                                 batch_size=FETCH_BATCH_SIZE)
+        df = _documents_to_dataframe(cursor)
+    
+    return _parse_date_fields(df)
+
+def _find_arrow_dataframe(collection, model_name, query, fields, sort, skip, limit):
+    """Build a DataFrame for a query with pymongoarrow using the model's Arrow schema"""
+    schema = ARROW_SCHEMAS[model_name]
     
+    # Narrow the schema to the requested fields; pymongoarrow projects on the schema
+    if fields:
+        included = set(fields) | {'_id'}
+        schema = {field: kind for field, kind in schema.items() if field in included}
+    
+    return find_pandas_all(collection, query, schema=Schema(schema),
+                           sort=sort, skip=skip, limit=limit)
+
+def _documents_to_dataframe(documents):
+    """Build a DataFrame from an iterable of raw documents, one batch at a time"""
+    # Only a single batch of dicts is alive at once; take one iterator up front since
+    # querysets restart from the beginning every time they are iterated
+    documents = iter(documents)
+    chunks = []
+    while True:
+        batch = list(islice(documents, FETCH_BATCH_SIZE))
+        if not batch:
+            break
+        chunks.append(pd.DataFrame.from_records(batch))
+    
+    if not chunks:
+        return pd.DataFrame()
+    return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+
+def _parse_date_fields(df):
+    """Convert the MongoDB date fields present in a DataFrame to UTC timestamps"""
+    # pymongo already returns datetimes (missing values come back as None/NaN),
+    # so there is no '$date' wrapper to unwrap
+    for field in df.columns.intersection(DATE_FIELDS):
+        df[field] = _to_utc_datetime(df[field])
     return df
 
-def add_trendline(fig, df, x_col, y_col, line_name="Trend", color="red", dash="dash"):
-    """Add a trendline to a Plotly figure"""
-    # Only calculate trendline if we have enough data points
-    if len(df) >= 2:
-        # Remove NaN values
-        valid_data = df[[x_col, y_col]].dropna()
+def _prepare_regression(df, x_col, y_col):
+    """
+    Fit a linear regression of y_col on x_col, shared by the trend helpers
+    
+    Args:
+        df: DataFrame with the data
+        x_col: Column for the x-axis (datetime or numeric)
+        y_col: Column for the y-axis
         
-        if len(valid_data) >= 2:
-            # For datetime x-axis, convert to numeric (days since epoch)
-            if pd.api.types.is_datetime64_any_dtype(valid_data[x_col]):
-                # Get numeric x values (days since epoch)
-                x_numeric = valid_data[x_col].map(pd.Timestamp.timestamp) / 86400
-            else:
-                x_numeric = valid_data[x_col]
-            
-            # Calculate trend line with linear regression
-            slope, intercept, r_value, p_value, std_err = stats.linregress(
-                x_numeric, valid_data[y_col]
-            )
-            
-            # Create x values for the trendline
-            x_range = np.linspace(x_numeric.min(), x_numeric.max(), 100)
-            
-            # Calculate y values for the trendline
-            y_range = slope * x_range + intercept
+    Returns:
+        Tuple of (x_numeric, y, slope, intercept, r_squared, x_is_datetime) as
+        NumPy values, or None if there are fewer than two valid data points
+    """
+    # Only calculate a regression if we have enough data points
+    if len(df) < 2:
+        return None
+    
+    # Remove NaN values
+    valid_data = df[[x_col, y_col]].dropna()
+    if len(valid_data) < 2:
+        return None
+    
+    # For datetime x-axis, convert to numeric (days since epoch) with a single cast
+    x_is_datetime = pd.api.types.is_datetime64_any_dtype(valid_data[x_col])
+    if x_is_datetime:
+        x_numeric = valid_data[x_col].values.astype('datetime64[ns]').astype('int64') / (86400 * 1e9)
+    else:
+        x_numeric = valid_data[x_col].to_numpy()
+    y = valid_data[y_col].to_numpy()
+    
+    # Calculate trend line with closed-form least squares
+    x = x_numeric.astype(np.float64)
+    y = y.astype(np.float64)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    dy = y - y_mean
+    sxx = (dx * dx).sum()
+    sxy = (dx * dy).sum()
+    syy = (dy * dy).sum()
+    
+    # A vertical line has no defined slope
+    if sxx == 0:
+        return None
+    
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+    r_squared = (sxy * sxy) / (sxx * syy) if syy != 0 else 0.0
+    
+    return x, y, slope, intercept, r_squared, x_is_datetime
+
+def _to_utc_datetime(series):
+    """
+    Convert a date column to UTC-aware datetime64 using the cheapest path available
+    
+    Args:
+        series: Column of datetimes, ISO-8601 strings or nulls
+        
+    Returns:
+        Series with datetime64 UTC dtype, unparseable values as NaT
+    """
+    # Columns pandas already inferred as datetime64 only need a timezone attached
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is None:
+            return series.dt.tz_localize('UTC')
+        return series.dt.tz_convert('UTC')
+    
+    # Mixed/object columns: MongoDB dates are ISO-8601, so skip format inference
+    return pd.to_datetime(series, utc=True, format='ISO8601', errors='coerce')
+
+def add_trendline(fig, df, x_col, y_col, line_name="Trend", color="red", dash="dash", regression=None):
+    """Add a trendline to a Plotly figure, reusing a precomputed regression if given"""
+    if regression is None:
+        regression = _prepare_regression(df, x_col, y_col)
+    
+    if regression is not None:
+        x_numeric, _, slope, intercept, r_squared, x_is_datetime = regression
+        
+        # Create x values for the trendline
+        x_range = np.linspace(x_numeric.min(), x_numeric.max(), 100)
+        
+        # Calculate y values for the trendline
+        y_range = slope * x_range + intercept
+        
+        # If x was datetime, convert back
+        if x_is_datetime:
+            x_dates = pd.to_datetime((x_range * 86400 * 1e9).astype('int64'))
             
-            # If x was datetime, convert back
-            if pd.api.types.is_datetime64_any_dtype(valid_data[x_col]):
-                x_dates = [pd.Timestamp.fromtimestamp(x * 86400) for x in x_range]
-                
-                # Add trendline trace
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_dates,
-                        y=y_range,
-                        mode='lines',
-                        name=f"{line_name} (r²={r_value**2:.2f})",
-                        line=dict(color=color, dash=dash),
-                    )
+            # Add trendline trace
+            fig.add_trace(
+                go.Scatter(
+                    x=x_dates,
+                    y=y_range,
+                    mode='lines',
+                    name=f"{line_name} (r²={r_squared:.2f})",
+                    line=dict(color=color, dash=dash),
                 )
-            else:
-                # Add trendline trace for non-datetime x
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_range,
-                        y=y_range,
-                        mode='lines',
-                        name=f"{line_name} (r²={r_value**2:.2f})",
-                        line=dict(color=color, dash=dash),
-                    )
+            )
+        else:
+            # Add trendline trace for non-datetime x
+            fig.add_trace(
+                go.Scatter(
+                    x=x_range,
+                    y=y_range,
+                    mode='lines',
+                    name=f"{line_name} (r²={r_squared:.2f})",
+                    line=dict(color=color, dash=dash),
                 )
+            )
     
     return fig
 
-def calculate_trend_metrics(df, date_col, value_col):
+def calculate_trend_metrics(df, date_col, value_col, regression=None):
     """Calculate trend direction and percentage change over time"""
-    if len(df) < 2:
-        return "Not enough data", 0
-        
-    # Remove NaN values
-    valid_data = df[[date_col, value_col]].dropna()
+    if regression is None:
+        regression = _prepare_regression(df, date_col, value_col)
     
-    if len(valid_data) < 2:
+    if regression is None:
         return "Not enough data", 0
-        
-    # For datetime x-axis, convert to numeric (days since epoch)
-    if pd.api.types.is_datetime64_any_dtype(valid_data[date_col]):
-        # Get numeric x values (days since epoch)
-        x_numeric = valid_data[date_col].map(pd.Timestamp.timestamp) / 86400
-    else:
-        x_numeric = valid_data[date_col]
     
-    # Calculate trend with linear regression
-    slope, intercept, r_value, p_value, std_err = stats.linregress(
-        x_numeric, valid_data[value_col]
-    )
+    x_numeric, _, slope, intercept, _, _ = regression
     
     # Calculate start and end points of trend line
     y_start = slope * x_numeric.min() + intercept
@@ -142,15 +283,18 @@ def create_time_series_chart(df, date_col, value_col, title, y_label, include_tr
     )
     
     if include_trendline:
-        fig = add_trendline(fig, df, date_col, value_col)
+        # Fit the regression once and share it between the trendline and the trend text
+        regression = _prepare_regression(df, date_col, value_col)
+        fig = add_trendline(fig, df, date_col, value_col, regression=regression)
         
         # Add trend analysis text
-        direction, percent_change = calculate_trend_metrics(df, date_col, value_col)
+        direction, percent_change = calculate_trend_metrics(df, date_col, value_col, regression=regression)
         if direction != "Not enough data":
+            higher_is_better = value_col in _POSITIVE_TREND_COLS
             if direction == "Increasing":
-                trend_color = "green" if value_col in ['merged_count', 'commit_count'] else "red"
+                trend_color = "green" if higher_is_better else "red"
             else:
-                trend_color = "red" if value_col in ['merged_count', 'commit_count'] else "green"
+                trend_color = "red" if higher_is_better else "green"
                 
             fig.add_annotation(
                 x=0.5,
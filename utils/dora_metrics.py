@@ -7,10 +7,54 @@ DORA metrics measure software delivery performance using four key metrics:
 3. Change Failure Rate
 4. Time to Restore Service
 """
+import re
 import pandas as pd
+import numpy as np
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
+from models import WorkflowRun
+
+# Workflow names matching any of these keywords count as deployments
+DEPLOY_KEYWORDS = ['deploy', 'release', 'publish']
+_DEPLOY_RE = re.compile('|'.join(DEPLOY_KEYWORDS), re.IGNORECASE)
+
+# MongoDB $dateTrunc units for the supported grouping periods
+DATE_TRUNC_UNITS = {'D': 'day', 'W': 'week', 'M': 'month'}
+
+def _as_datetime(series):
+    """Return the series as datetime64, only parsing it if it isn't one already"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, errors='coerce')
+
+def _period_start(series, period):
+    """
+    Get the start timestamp of the period each value falls in
+    
+    Args:
+        series: Datetime series (naive or tz-aware)
+        period: Time period ('D' for daily, 'W' for weekly starting Monday, 'M' for monthly)
+        
+    Returns:
+        Series of naive period start timestamps, matching to_period(period).start_time
+    """
+    # Work on the raw datetime64 values (UTC for tz-aware columns) with plain
+    # NumPy casts instead of allocating a PeriodArray
+    days = series.values.astype('datetime64[D]')
+    
+    if period == 'D':
+        starts = days
+    elif period == 'W':
+        # 1970-01-01 was a Thursday, so (days since epoch + 3) % 7 is the weekday with Monday = 0
+        weekday = (days.view('int64') + 3) % 7
+        starts = days - weekday.astype('timedelta64[D]')
+    elif period == 'M':
+        starts = days.astype('datetime64[M]')
+    else:
+        return series.dt.to_period(period).dt.start_time
+    
+    return pd.Series(starts.astype('datetime64[ns]'), index=series.index, name=series.name)
 
 def calculate_lead_time(pr_df):
     """
@@ -25,15 +69,11 @@ def calculate_lead_time(pr_df):
     if pr_df.empty or 'merged_at' not in pr_df.columns or 'created_at' not in pr_df.columns:
         return pr_df
         
-    # Create a copy to avoid modifying the original
-    result_df = pr_df.copy()
-    
-    # Calculate lead time in days
-    result_df['lead_time_days'] = (
-        result_df['merged_at'] - result_df['created_at']
-    ).dt.total_seconds() / (3600 * 24)
+    # Calculate lead time in days on the raw datetime64 arrays
+    lead_time = (pr_df['merged_at'].values - pr_df['created_at'].values) / np.timedelta64(1, 'D')
     
-    return result_df
+    # assign() shares the existing columns instead of copying the whole frame
+    return pr_df.assign(lead_time_days=lead_time)
 
 def calculate_deployment_frequency(workflow_df, start_date, end_date, period='W'):
     """
@@ -51,16 +91,14 @@ def calculate_deployment_frequency(workflow_df, start_date, end_date, period='W'
     if workflow_df.empty:
         return pd.DataFrame()
         
-    # Filter for deployment/release workflows
-    deploy_keywords = ['deploy', 'release', 'publish']
-    
     # Check if necessary columns exist
     if 'workflow_name' not in workflow_df.columns or 'conclusion' not in workflow_df.columns:
         return pd.DataFrame()
         
     # Filter successful deployments
     deployment_runs = workflow_df[
-        (workflow_df['workflow_name'].str.lower().str.contains('|'.join(deploy_keywords)))
+        # Case-insensitive match with the precompiled pattern; runs without a name never match
+        (workflow_df['workflow_name'].str.contains(_DEPLOY_RE, na=False))
         & (workflow_df['conclusion'] == 'success')
     ]
     
@@ -69,13 +107,81 @@ def calculate_deployment_frequency(workflow_df, start_date, end_date, period='W'
         
     # Extract time period
     period_col = f"{period.lower()}_period"
-    deployment_runs[period_col] = pd.to_datetime(deployment_runs['created_at']).dt.to_period(period).dt.start_time
+    deployment_runs = deployment_runs.assign(**{
+        period_col: _period_start(_as_datetime(deployment_runs['created_at']), period)
+    })
     
     # Group by period and repo
-    deploy_freq = deployment_runs.groupby([period_col, 'repo']).size().reset_index(name='deploy_count')
+    # Low-cardinality repo names group faster as categorical codes
+    deployment_runs = deployment_runs.assign(repo=deployment_runs['repo'].astype('category'))
+    deploy_freq = deployment_runs.groupby([period_col, 'repo'], observed=True).size().reset_index(name='deploy_count')
     
     return deploy_freq
 
+@st.cache_data(ttl=600)
+def get_deployment_frequency(selected_repos, start_date, end_date, period='W'):
+    """
+    Calculate deployment frequency with a MongoDB aggregation instead of loading workflow runs
+    
+    Args:
+        selected_repos: List of selected repository names (empty for all repositories)
+        start_date: Starting date for analysis
+        end_date: Ending date for analysis
+        period: Time period for grouping ('D' for daily, 'W' for weekly, 'M' for monthly)
+        
+    Returns:
+        DataFrame with deployment frequency by repo and time period, in the same
+        shape as calculate_deployment_frequency
+        
+    Raises:
+        ValueError: If period is not one of DATE_TRUNC_UNITS
+    """
+    if period not in DATE_TRUNC_UNITS:
+        raise ValueError(
+            f"Unsupported period {period!r} for deployment frequency; "
+            f"expected one of {sorted(DATE_TRUNC_UNITS)}"
+        )
+    period_col = f"{period.lower()}_period"
+    
+    # Weeks start on Monday, matching to_period('W'); other units take no startOfWeek
+    date_trunc = {'date': '$created_at', 'unit': DATE_TRUNC_UNITS[period]}
+    if date_trunc['unit'] == 'week':
+        date_trunc['startOfWeek'] = 'monday'
+    
+    # Successful deployment runs in range; the compiled pattern is sent to MongoDB as a regex
+    filter_args = {
+        'created_at__gte': start_date,
+        'created_at__lte': end_date,
+        'conclusion': 'success',
+        'workflow_name': _DEPLOY_RE,
+    }
+    if selected_repos:
+        filter_args['repo__in'] = selected_repos
+    
+    # The queryset filter becomes the leading $match stage, so only the grouped
+    # counts leave the server
+    pipeline = [
+        {'$group': {
+            '_id': {
+                'period': {'$dateTrunc': date_trunc},
+                'repo': '$repo'
+            },
+            'deploy_count': {'$sum': 1}
+        }},
+        {'$sort': {'_id.period': 1, '_id.repo': 1}}
+    ]
+    results = WorkflowRun.objects(**filter_args).aggregate(pipeline)
+    
+    deploy_freq = pd.DataFrame.from_records(
+        [(doc['_id']['period'], doc['_id']['repo'], doc['deploy_count']) for doc in results],
+        columns=[period_col, 'repo', 'deploy_count']
+    )
+    if deploy_freq.empty:
+        return pd.DataFrame()
+    
+    deploy_freq[period_col] = pd.to_datetime(deploy_freq[period_col])
+    return deploy_freq
+
 def render_lead_time_chart(lead_time_df, group_by='team', title_prefix='Team'):
     """
     Render lead time chart grouped by team or repo
@@ -92,7 +198,7 @@ def render_lead_time_chart(lead_time_df, group_by='team', title_prefix='Team'):
         return None
         
     # Calculate average lead time by group
-    lead_time_grouped = lead_time_df.groupby(group_by)['lead_time_days'].mean().reset_index()
+    lead_time_grouped = lead_time_df.groupby(group_by, observed=True)['lead_time_days'].mean().reset_index()
     lead_time_grouped['lead_time_days'] = lead_time_grouped['lead_time_days'].round(2)
     
     # Create the chart
@@ -154,15 +260,14 @@ def render_pr_frequency_chart(pr_df, group_by='team', period='W', title=None):
     if pr_df.empty or 'merged_at' not in pr_df.columns:
         return None
     
-    # Create a copy to avoid modifying the original
-    result_df = pr_df.copy()
-    
-    # Extract time period
+    # Extract time period into a new frame that shares the PR columns
     period_col = 'week' if period == 'W' else 'period'
-    result_df[period_col] = pd.to_datetime(result_df['merged_at']).dt.to_period(period).dt.start_time
+    result_df = pr_df.assign(**{
+        period_col: _period_start(_as_datetime(pr_df['merged_at']), period)
+    })
     
     # Group by period and team/repo
-    freq_df = result_df.groupby([period_col, group_by]).size().reset_index(name='merge_count')
+    freq_df = result_df.groupby([period_col, group_by], observed=True).size().reset_index(name='merge_count')
     
     # Set default title if none provided
     if title is None:
@@ -7,9 +7,6 @@ import logging
 from models import Team
 from utils.data_processing import queryset_to_dataframe
 
-# Global cache for team member mapping
-_TEAM_MEMBER_CACHE = None
-
 @st.cache_data(ttl=600)
 def get_team_data():
     """Get team data from database"""
@@ -25,13 +22,15 @@ def get_member_team_mapping(force_refresh=False):
     Returns:
         Dictionary mapping authors to their team names
     """
-    global _TEAM_MEMBER_CACHE
-    
-    # Return cached mapping if available and not forcing refresh
-    if _TEAM_MEMBER_CACHE is not None and not force_refresh:
-        return _TEAM_MEMBER_CACHE
+    # Drop the cached mapping so it is rebuilt below
+    if force_refresh:
+        _build_member_team_mapping.clear()
     
-    # Create new mapping
+    return _build_member_team_mapping()
+
+@st.cache_data(ttl=600)
+def _build_member_team_mapping():
+    """Build the member -> team mapping from the team collection"""
     mapping = {}
     team_df = get_team_data()
     
@@ -39,16 +38,17 @@ def get_member_team_mapping(force_refresh=False):
         logging.warning("No team data found in database")
         return mapping
     
-    for _, team in team_df.iterrows():
-        if 'members' in team and isinstance(team['members'], list):
-            team_name = team['name']
-            for member in team['members']:
+    if 'members' not in team_df.columns:
+        return mapping
+    
+    # Walk the raw column arrays together rather than materializing a row object per team
+    for team_name, members in zip(team_df['name'].values, team_df['members'].values):
+        if isinstance(members, list):
+            for member in members:
                 if member in mapping:
                     logging.info(f"Member {member} belongs to multiple teams. Using {team_name} instead of {mapping[member]}")
                 mapping[member] = team_name
     
-    # Cache the mapping
-    _TEAM_MEMBER_CACHE = mapping
     return mapping
 
 def augment_dataframe_with_team_info(df, team_df=None, author_field='author', default_team='Other'):
@@ -67,8 +67,8 @@ def augment_dataframe_with_team_info(df, team_df=None, author_field='author', de
     if df.empty or author_field not in df.columns:
         return df
     
-    # Copy dataframe to avoid modifying the original
-    result_df = df.copy()
+    authors = df[author_field]
+    has_author = authors.notna()
     
     # Get mapping and add team column
     mapping = get_member_team_mapping()
@@ -76,13 +76,13 @@ def augment_dataframe_with_team_info(df, team_df=None, author_field='author', de
     # Check if we have team mapping data
     if not mapping:
         # No team data available, just use default team for everyone
-        result_df['team'] = result_df[author_field].apply(
-            lambda x: default_team if pd.notna(x) else "Unassigned"
-        )
-        return result_df
+        # assign() returns a new frame sharing the existing columns, so the
+        # caller's DataFrame is left untouched without copying it
+        team = pd.Series(default_team, index=df.index).where(has_author, "Unassigned")
+        return df.assign(team=team.astype('category'))
     
     # Create a set of all authors for efficient lookup
-    all_authors = set(df[author_field].dropna().unique())
+    all_authors = set(authors[has_author].unique())
     mapped_authors = set(mapping.keys())
     
     # Check for unmapped authors
@@ -100,12 +100,12 @@ def augment_dataframe_with_team_info(df, team_df=None, author_field='author', de
             logging.info("Refreshing team mapping cache due to high number of unmapped authors")
             mapping = get_member_team_mapping(force_refresh=True)
     
-    # Map authors to teams, using default_team instead of "Unmapped"
-    result_df['team'] = result_df[author_field].map(
-        lambda x: mapping.get(x, default_team) if pd.notna(x) else "Unassigned"
-    )
+    # Map authors to teams with a vectorized dict lookup, using default_team
+    # instead of "Unmapped" and "Unassigned" for rows without an author
+    team = authors.map(mapping).where(has_author, "Unassigned").fillna(default_team)
     
-    return result_df
+    # Only a handful of distinct teams, so group on small integer codes
+    return df.assign(team=team.astype('category'))
 
 def map_authors_to_teams(author_list, team_df=None):
     """